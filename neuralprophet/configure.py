@@ -1,12 +1,13 @@
-from collections import OrderedDict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Generic, Optional, TypeVar, Tuple, Type
 import numpy as np
 import pandas as pd
 import logging
-import inspect
+import functools
+import contextlib
 import torch
 import math
+import os
 import types
 
 from neuralprophet import utils_torch, utils, df_utils
@@ -14,8 +15,13 @@ from neuralprophet import utils_torch, utils, df_utils
 log = logging.getLogger("NP.config")
 
 
+@functools.lru_cache(maxsize=None)
+def _init_field_names(cls):
+    return frozenset(f.name for f in fields(cls) if f.init)
+
+
 def from_kwargs(cls, kwargs):
-    return cls(**{k: v for k, v in kwargs.items() if k in inspect.signature(cls).parameters})
+    return cls(**{k: kwargs[k] for k in _init_field_names(cls) if k in kwargs})
 
 
 @dataclass
@@ -32,8 +38,11 @@ class Normalization:
     unknown_data_normalization: bool
     local_data_params: dict = None  # nested dict (key1: name of dataset, key2: name of variable)
     global_data_params: dict = None  # dict where keys are names of variables
+    # (scale, shift) of ``y`` per dataset name, reset whenever the data params are re-initialized
+    _y_scale_shift: dict = field(default_factory=dict, init=False, repr=False)
 
     def init_data_params(self, df_dict, covariates_config=None, regressor_config=None, events_config=None):
+        self._y_scale_shift = {}
         if len(df_dict) == 1:
             if not self.global_normalization:
                 log.info("Setting normalization to global as only one dataframe provided for training.")
@@ -70,6 +79,20 @@ class Normalization:
                 )
         return data_params
 
+    def get_y_scale_shift(self, df_names):
+        """Collects the ``y`` normalization of several datasets into one array of shape (len(df_names), 2)."""
+        cache = getattr(self, "_y_scale_shift", None)
+        if cache is None:
+            # configs pickled before the cache was added do not have it
+            cache = self._y_scale_shift = {}
+        scale_shift = []
+        for df_name in df_names:
+            if df_name not in cache:
+                params = self.get_data_params(df_name)["y"]
+                cache[df_name] = (params.scale, params.shift)
+            scale_shift.append(cache[df_name])
+        return np.array(scale_shift, dtype=np.float64).reshape(-1, 2)
+
 
 @dataclass
 class Train:
@@ -84,13 +107,43 @@ class Train:
     reg_lambda_trend: float = None
     trend_reg_threshold: (bool, float) = None
     reg_lambda_season: float = None
+    compile_model: bool = False
+    device: (str, torch.device) = "cpu"
+    num_workers: (int, str) = 0
+    prefetch_factor: int = 2
+    mixed_precision: (bool, str) = False
+    allow_tf32: bool = False
     n_data: int = field(init=False)
     loss_func_name: str = field(init=False)
+    autocast_dtype: torch.dtype = field(init=False)
 
     def __post_init__(self):
         assert self.newer_samples_weight >= 1.0
         assert self.newer_samples_start >= 0.0
         assert self.newer_samples_start < 1.0
+        if self.device == "auto":
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(self.device)
+        if self.num_workers == "auto":
+            # samples are precomputed by the dataset, workers only pay off when they overlap with GPU compute
+            self.num_workers = min(8, os.cpu_count() or 1) if self.device.type == "cuda" else 0
+        assert self.num_workers >= 0
+        assert self.prefetch_factor >= 1
+        self.autocast_dtype = None
+        if self.mixed_precision:
+            if self.mixed_precision not in [True, "bf16", "fp16"]:
+                raise ValueError("Mixed precision {} not supported, use 'bf16' or 'fp16'.".format(self.mixed_precision))
+            if not hasattr(torch, "autocast"):
+                log.warning("Mixed precision requires torch>=1.10. Training in full precision.")
+            elif self.mixed_precision == "fp16":
+                if self.device.type != "cuda":
+                    log.warning("Mixed precision fp16 requires a CUDA device. Training in full precision.")
+                else:
+                    # float16 needs loss scaling to keep small gradients from underflowing, see get_grad_scaler
+                    self.autocast_dtype = torch.float16
+            else:
+                # bfloat16 has the range of float32, no gradient scaling needed. Also supported by CPU autocast.
+                self.autocast_dtype = torch.bfloat16
         if type(self.loss_func) == str:
             if self.loss_func.lower() in ["huber", "smoothl1", "smoothl1loss"]:
                 self.loss_func = torch.nn.SmoothL1Loss(reduction="none")
@@ -110,6 +163,38 @@ class Train:
             else:
                 raise NotImplementedError("Loss function {} not found".format(self.loss_func))
 
+    @property
+    def pin_memory(self):
+        # page-locked host memory only speeds up copies to a CUDA device
+        return self.device.type == "cuda"
+
+    @property
+    def eval_batch_size(self):
+        # no autograd graph is kept during evaluation and prediction, so batches can be much larger than in training
+        return max(4096, 4 * (self.batch_size or 0))
+
+    def get_loader_kwargs(self, persistent=True):
+        kwargs = {"num_workers": self.num_workers, "pin_memory": self.pin_memory}
+        if self.num_workers > 0:
+            kwargs["prefetch_factor"] = self.prefetch_factor
+            # keep workers alive across epochs instead of re-spawning them
+            kwargs["persistent_workers"] = persistent
+        return kwargs
+
+    def get_autocast(self):
+        """Context to run forward and loss computation in, with mixed precision if configured."""
+        if self.autocast_dtype is None:
+            return contextlib.nullcontext()
+        return torch.autocast(device_type=self.device.type, dtype=self.autocast_dtype)
+
+    def get_grad_scaler(self):
+        """Gradient scaler for float16 mixed precision training, None if not needed."""
+        if self.autocast_dtype != torch.float16:
+            return None
+        if hasattr(torch, "amp") and hasattr(torch.amp, "GradScaler"):
+            return torch.amp.GradScaler(self.device.type)
+        return torch.cuda.amp.GradScaler()
+
     def set_auto_batch_epoch(
         self,
         n_data: int,
@@ -178,6 +263,7 @@ class Train:
                 loss_func=loss_func,
                 optimizer=self.optimizer,
                 batch_size=self.batch_size,
+                pin_memory=self.pin_memory,
             )
             lrs.append(lr)
         lrs_log10_mean = sum([np.log10(x) for x in lrs]) / len(lrs)
@@ -251,19 +337,17 @@ class AllSeason:
     yearly_arg: (str, bool, int) = "auto"
     weekly_arg: (str, bool, int) = "auto"
     daily_arg: (str, bool, int) = "auto"
-    periods: OrderedDict = field(init=False)  # contains SeasonConfig objects
+    periods: dict = field(init=False)  # contains SeasonConfig objects
 
     def __post_init__(self):
         if self.reg_lambda > 0 and self.computation == "fourier":
             log.info("Note: Fourier-based seasonality regularization is experimental.")
             self.reg_lambda = 0.001 * self.reg_lambda
-        self.periods = OrderedDict(
-            {
-                "yearly": Season(resolution=6, period=365.25, arg=self.yearly_arg),
-                "weekly": Season(resolution=3, period=7, arg=self.weekly_arg),
-                "daily": Season(resolution=6, period=1, arg=self.daily_arg),
-            }
-        )
+        self.periods = {
+            "yearly": Season(resolution=6, period=365.25, arg=self.yearly_arg),
+            "weekly": Season(resolution=3, period=7, arg=self.weekly_arg),
+            "daily": Season(resolution=6, period=1, arg=self.daily_arg),
+        }
 
     def append(self, name, period, resolution, arg):
         self.periods[name] = Season(resolution=resolution, period=period, arg=arg)
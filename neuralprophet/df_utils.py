@@ -15,6 +15,33 @@ class ShiftScale:
     scale: float = 1.0
 
 
+def as_df_dict(df):
+    """Wraps a df into a df_dict without copying any data.
+
+    Only the dict itself is new, the dataframes are the ones passed in and must not be modified in place.
+
+    Parameters
+    ----------
+        df : pd.DataFrame,dict
+            containing df or dict with group of dfs
+
+    Returns
+    -------
+        dict
+            dict of dataframes
+        bool
+            whether the input was unnamed
+    """
+    if isinstance(df, dict):
+        return dict(df), False
+    elif isinstance(df, pd.DataFrame):
+        return {"__df__": df}, True
+    elif df is None:
+        return None, None
+    else:
+        raise ValueError("Please insert valid df type (i.e. pd.DataFrame, dict)")
+
+
 def prep_copy_df_dict(df):
     """Creates or copy a df_dict based on the df input.
     It either converts a pd.DataFrame to a dict or copies it in case of a dict input.
@@ -140,13 +167,13 @@ def data_params_definition(df, normalize, covariates_config=None, regressor_conf
                 ``soft`` scales the minimum value to 0.0 and the 95th quantile to 1.0
 
                 ``soft1`` scales the minimum value to 0.1 and the 90th quantile to 0.9
-    covariates_config : OrderedDict
+    covariates_config : dict
         extra regressors with sub_parameters
     normalize : bool
         data normalization
-    regressor_config : OrderedDict
+    regressor_config : dict
         extra regressors (with known future values) with sub_parameters normalize (bool)
-    events_config : OrderedDict
+    events_config : dict
         user specified events configs
 
     Returns
@@ -157,7 +184,7 @@ def data_params_definition(df, normalize, covariates_config=None, regressor_conf
 
     data_params = OrderedDict({})
     if df["ds"].dtype == np.int64:
-        df.loc[:, "ds"] = df.loc[:, "ds"].astype(str)
+        df["ds"] = df["ds"].astype(str)
     df.loc[:, "ds"] = pd.to_datetime(df.loc[:, "ds"])
     data_params["ds"] = ShiftScale(
         shift=df["ds"].min(),
@@ -229,11 +256,11 @@ def init_data_params(
                     ``soft`` scales the minimum value to 0.0 and the 95th quantile to 1.0
 
                     ``soft1`` scales the minimum value to 0.1 and the 90th quantile to 0.9
-        covariates_config : OrderedDict
+        covariates_config : dict
             extra regressors with sub_parameters
-        regressor_config : OrderedDict)
+        regressor_config : dict)
             extra regressors (with known future values)
-        events_config : OrderedDict
+        events_config : dict
             user specified events configs
         global_normalization : bool
 
@@ -256,7 +283,7 @@ def init_data_params(
             ShiftScale entries containing ``shift`` and ``scale`` parameters for each column
     """
     # Compute Global data params
-    df_merged, _ = join_dataframes(prep_copy_df_dict(df_dict)[0])
+    df_merged, _ = join_dataframes(as_df_dict(df_dict)[0])
     global_data_params = data_params_definition(
         df_merged, normalize, covariates_config, regressor_config, events_config
     )
@@ -355,6 +382,28 @@ def normalize(df, data_params):
     return df
 
 
+def normalize_ds_array(ds, data_params):
+    """
+    Applies the ``ds`` scaling factors of data_params to an array of timestamps.
+
+    Parameters
+    ----------
+        ds : np.array
+            timestamps, datetime64 or convertible to it
+        data_params : OrderedDict
+            scaling values, as returned by init_data_params with a ShiftScale entry for ``ds``
+
+    Returns
+    -------
+        np.array
+            normalized time ``t`` as float
+    """
+    ds = np.asarray(ds, dtype="datetime64[ns]")
+    shift = pd.Timestamp(data_params["ds"].shift).to_datetime64()
+    scale = pd.Timedelta(data_params["ds"].scale).to_timedelta64()
+    return (ds - shift) / scale
+
+
 def check_single_dataframe(df, check_y, covariates, regressors, events):
     """Performs basic data sanity checks and ordering
     as well as prepare dataframe for fitting or predicting.
@@ -375,18 +424,25 @@ def check_single_dataframe(df, check_y, covariates, regressors, events):
     Returns
     -------
         pd.DataFrame
+            checked dataframe, sharing unchanged columns with the input
     """
     if df.shape[0] == 0:
         raise ValueError("Dataframe has no rows.")
+    # replace columns on a shallow copy instead of writing into the caller's data
+    df = df.copy(deep=False)
+    if df.index.name == "ds":
+        # an index named like the column makes sorting by "ds" ambiguous. The index is shared with the caller's
+        # dataframe, so it is replaced rather than renamed in place.
+        df.index = df.index.rename(None)
 
     if "ds" not in df:
         raise ValueError('Dataframe must have columns "ds" with the dates.')
     if df.loc[:, "ds"].isnull().any():
         raise ValueError("Found NaN in column ds.")
     if df["ds"].dtype == np.int64:
-        df.loc[:, "ds"] = df.loc[:, "ds"].astype(str)
+        df["ds"] = df["ds"].astype(str)
     if not np.issubdtype(df["ds"].dtype, np.datetime64):
-        df.loc[:, "ds"] = pd.to_datetime(df.loc[:, "ds"])
+        df["ds"] = pd.to_datetime(df["ds"])
     if df["ds"].dt.tz is not None:
         raise ValueError("Column ds has timezone specified, which is not supported. Remove timezone.")
 
@@ -417,14 +473,16 @@ def check_single_dataframe(df, check_y, covariates, regressors, events):
         if df.loc[df.loc[:, name].notnull()].shape[0] < 1:
             raise ValueError("Dataframe column {name!r} only has NaN rows.".format(name=name))
         if not np.issubdtype(df[name].dtype, np.number):
-            df.loc[:, name] = pd.to_numeric(df.loc[:, name])
+            df[name] = pd.to_numeric(df[name])
         if np.isinf(df.loc[:, name].values).any():
-            df.loc[:, name] = df[name].replace([np.inf, -np.inf], np.nan)
+            df[name] = df[name].replace([np.inf, -np.inf], np.nan)
         if df.loc[df.loc[:, name].notnull()].shape[0] < 1:
             raise ValueError("Dataframe column {name!r} only has NaN rows.".format(name=name))
 
-    if df.index.name == "ds":
-        df.index.name = None
+    if df["ds"].is_monotonic_increasing:
+        # already in order (e.g. checked before), only give the shallow copy a fresh index instead of copying the data
+        df.index = pd.RangeIndex(len(df))
+        return df
     df = df.sort_values("ds")
     df = df.reset_index(drop=True)
     return df
@@ -499,7 +557,7 @@ def crossvalidation_split_df(df, n_lags, n_forecasts, k, fold_pct, fold_overlap_
     min_train = total_samples - samples_fold - (k - 1) * (samples_fold - samples_overlap)
     assert min_train >= samples_fold
     folds = []
-    df_fold = df.copy(deep=True)
+    df_fold = df
     for i in range(k, 0, -1):
         df_train, df_val = split_df(df_fold, n_lags, n_forecasts, valid_p=samples_fold, inputs_overbleed=True)
         folds.append((df_train, df_val))
@@ -572,8 +630,9 @@ def _split_df(df, n_lags, n_forecasts, valid_p, inputs_overbleed):
 
     split_idx_train = n_train + n_lags + n_forecasts - 1
     split_idx_val = split_idx_train - n_lags if inputs_overbleed else split_idx_train
-    df_train = df.copy(deep=True).iloc[:split_idx_train].reset_index(drop=True)
-    df_val = df.copy(deep=True).iloc[split_idx_val:].reset_index(drop=True)
+    # reset_index returns a copy of the sliced rows only
+    df_train = df.iloc[:split_idx_train].reset_index(drop=True)
+    df_val = df.iloc[split_idx_val:].reset_index(drop=True)
     log.debug("{} n_train, {} n_eval".format(n_train, n_samples - n_train))
     return df_train, df_val
 
@@ -639,16 +698,16 @@ def split_considering_timestamp(df_dict, n_lags, n_forecasts, inputs_overbleed,
     df_val = {}
     for key in df_dict:
         if df_dict[key]["ds"].max() < threshold_time_stamp:
-            df_train[key] = df_dict[key].copy(deep=True).reset_index(drop=True)
+            df_train[key] = df_dict[key].reset_index(drop=True)
         elif df_dict[key]["ds"].min() > threshold_time_stamp:
-            df_val[key] = df_dict[key].copy(deep=True).reset_index(drop=True)
+            df_val[key] = df_dict[key].reset_index(drop=True)
         else:
-            df = df_dict[key].copy(deep=True)
+            df = df_dict[key]
             n_train = len(df[df["ds"] < threshold_time_stamp])
             split_idx_train = n_train + n_lags + n_forecasts - 1
             split_idx_val = split_idx_train - n_lags if inputs_overbleed else split_idx_train
-            df_train[key] = df.copy(deep=True).iloc[:split_idx_train].reset_index(drop=True)
-            df_val[key] = df.copy(deep=True).iloc[split_idx_val:].reset_index(drop=True)
+            df_train[key] = df.iloc[:split_idx_train].reset_index(drop=True)
+            df_val[key] = df.iloc[split_idx_val:].reset_index(drop=True)
     return df_train, df_val
 
 
@@ -724,11 +783,11 @@ def make_future_df(
         freq : str
             Data step sizes. Frequency of data recording, any valid frequency
             for pd.date_range, such as ``D`` or ``M``
-        events_config : OrderedDict
+        events_config : dict
             User specified events configs
         events_df : pd.DataFrame
             containing column ``ds`` and ``event``
-        regressor_config : OrderedDict
+        regressor_config : dict
             configuration for user specified regressors,
         regressors_df : pd.DataFrame
             containing column ``ds`` and one column for each of the external regressors
@@ -766,7 +825,7 @@ def convert_events_to_features(df, events_config, events_df):
     ----------
         df : pd.DataFrame
             Dataframe with columns ``ds`` datestamps and ``y`` time series values
-        events_config : OrderedDict
+        events_config : dict
             User specified events configs
         events_df : pd.DataFrame
             containing column ``ds`` and ``event``
@@ -776,12 +835,14 @@ def convert_events_to_features(df, events_config, events_df):
         pd.DataFrame
             input df with columns for user_specified features
     """
-
+    ds = df["ds"].values
+    event_dates = {event: pd.to_datetime(dates).values for event, dates in events_df.groupby("event")["ds"]}
     for event in events_config.keys():
-        event_feature = pd.Series([0.0] * df.shape[0])
-        dates = events_df[events_df.event == event].ds
-        event_feature[df.ds.isin(dates)] = 1.0
-        df[event] = event_feature
+        # binary features are exact in float32, which is also what the model consumes
+        if event in event_dates:
+            df[event] = np.isin(ds, event_dates[event]).astype(np.float32)
+        else:
+            df[event] = np.zeros(len(df), dtype=np.float32)
     return df
 
 
@@ -802,7 +863,7 @@ def add_missing_dates_nan(df, freq):
             dataframe without date-gaps but nan-values
     """
     if df["ds"].dtype == np.int64:
-        df.loc[:, "ds"] = df.loc[:, "ds"].astype(str)
+        df["ds"] = df["ds"].astype(str)
     df.loc[:, "ds"] = pd.to_datetime(df.loc[:, "ds"])
 
     data_len = len(df)
@@ -812,13 +873,36 @@ def add_missing_dates_nan(df, freq):
     return df_all, num_added
 
 
+def count_nans_at_end(values):
+    """Counts the consecutive missing values at the end of one or more columns.
+
+    Parameters
+    ----------
+        values : np.array, pd.Series, pd.DataFrame
+            one column of values or several columns side by side
+
+    Returns
+    -------
+        int
+            largest number of consecutive NaN at the end of any column
+    """
+    isnull = pd.isnull(np.asarray(values))
+    if isnull.size == 0:
+        return 0
+    isnull = isnull.reshape(len(isnull), -1)
+    notnull_reversed = ~isnull[::-1]
+    # position of the last observed value, counted from the end
+    nans_at_end = np.where(notnull_reversed.any(axis=0), notnull_reversed.argmax(axis=0), len(isnull))
+    return int(nans_at_end.max())
+
+
 def fill_linear_then_rolling_avg(series, limit_linear, rolling):
     """Adds missing dates, fills missing values with linear imputation or trend.
 
     Parameters
     ----------
-        series : pd.Series
-            series with nan to be filled in.
+        series : pd.Series, pd.DataFrame
+            series with nan to be filled in, or several such series as columns of a dataframe
         limit_linear : int
             maximum number of missing values to impute.
 
@@ -835,16 +919,18 @@ def fill_linear_then_rolling_avg(series, limit_linear, rolling):
 
     Returns
     -------
-        pd.DataFrame
-            manipulated dataframe containing filled values
+        pd.Series, pd.DataFrame
+            manipulated series or dataframe containing filled values
+        int, pd.Series
+            number of remaining missing values, per column in case of a dataframe
     """
     # impute small gaps linearly:
     series = series.interpolate(method="linear", limit=limit_linear, limit_direction="both")
     # fill remaining gaps with rolling avg
     is_na = pd.isna(series)
     rolling_avg = series.rolling(rolling + 2 * limit_linear, min_periods=2 * limit_linear, center=True).mean()
-    series.loc[is_na] = rolling_avg[is_na]
-    remaining_na = sum(series.isnull())
+    series = series.mask(is_na, rolling_avg)
+    remaining_na = series.isnull().sum()
     return series, remaining_na
 
 
@@ -1063,7 +1149,7 @@ def infer_frequency(df, freq, n_lags, min_freq_percentage=0.7):
 
     """
 
-    df_dict, received_unnamed_df = prep_copy_df_dict(df)
+    df_dict, received_unnamed_df = as_df_dict(df)
     freq_df = list()
     for key in df_dict:
         freq_df.append(_infer_frequency(df_dict[key], freq, min_freq_percentage))
@@ -1,10 +1,8 @@
 import time
-from collections import OrderedDict
 import numpy as np
 import pandas as pd
 
 import torch
-from torch.utils.data import DataLoader
 import logging
 from tqdm import tqdm
 
@@ -13,8 +11,7 @@ from neuralprophet import time_net
 from neuralprophet import time_dataset
 from neuralprophet import df_utils
 from neuralprophet import utils
-from neuralprophet.plot_forecast import plot, plot_components
-from neuralprophet.plot_model_parameters import plot_parameters
+from neuralprophet import utils_torch
 from neuralprophet import metrics
 
 log = logging.getLogger("NP.forecaster")
@@ -26,6 +23,27 @@ METRICS = {
     "rmse": metrics.RMSE,
 }
 
+_RESERVED_COMPONENT_NAMES = (
+    "trend",
+    "additive_terms",
+    "daily",
+    "weekly",
+    "yearly",
+    "events",
+    "holidays",
+    "zeros",
+    "extra_regressors_additive",
+    "yhat",
+    "extra_regressors_multiplicative",
+    "multiplicative_terms",
+)
+RESERVED_NAMES = frozenset(
+    _RESERVED_COMPONENT_NAMES
+    + tuple(n + "_lower" for n in _RESERVED_COMPONENT_NAMES)
+    + tuple(n + "_upper" for n in _RESERVED_COMPONENT_NAMES)
+    + ("ds", "y", "cap", "floor", "y_scaled", "cap_scaled")
+)
+
 
 class NeuralProphet:
     """NeuralProphet forecaster.
@@ -192,6 +210,44 @@ class NeuralProphet:
             Options
                 * (default) ``True``: [``mae``, ``rmse``]
                 * ``False``: No metrics
+        compile_model : bool
+            Compile the model with ``torch.compile`` before training (requires torch>=2.0).
+
+            Note
+            ----
+            Compilation takes time up front and pays off on large datasets or many epochs.
+            Default ``False``: train the eager model.
+        device : str, torch.device
+            Device to train and predict on.
+
+            Options
+                * (default) ``cpu``
+                * ``auto``: use CUDA if available, else CPU
+                * ``cuda``, ``cuda:<i>`` or a ``torch.device``
+        num_workers : int, str
+            Number of worker processes loading training, validation and prediction batches.
+
+            Options
+                * (default) ``0``: load batches in the main process
+                * ``auto``: up to 8 workers when training on CUDA, else 0
+                * ``value``: number of workers, kept alive across epochs
+        prefetch_factor : int
+            Number of batches each worker loads in advance, only used with ``num_workers`` > 0.
+        mixed_precision : bool, str
+            Train with mixed precision.
+
+            Options
+                * (default) ``False``: full precision
+                * ``True`` or ``bf16``: run forward pass and loss in bfloat16, on CUDA and CPU
+                * ``fp16``: run forward pass and loss in float16, with dynamic loss scaling, on CUDA only
+        allow_tf32 : bool
+            Allow TensorFloat-32 matrix multiplications when training on CUDA devices (Ampere or newer).
+
+            Note
+            ----
+            TF32 trades float32 mantissa bits for throughput. It is only allowed while ``fit`` runs,
+            the previous torch matmul precision is restored afterwards.
+            Default ``False``: keep full float32 precision.
 
         COMMENT
         Missing Data
@@ -266,6 +322,12 @@ class NeuralProphet:
         global_normalization=False,
         global_time_normalization=True,
         unknown_data_normalization=False,
+        compile_model=False,
+        device="cpu",
+        num_workers=0,
+        prefetch_factor=2,
+        mixed_precision=False,
+        allow_tf32=False,
     ):
         kwargs = locals()
 
@@ -353,7 +415,11 @@ class NeuralProphet:
         self.data_params = None
         self.optimizer = None
         self.scheduler = None
+        self.grad_scaler = None
         self.model = None
+        # model run in the training steps, a compiled wrapper of self.model if config_train.compile_model
+        self._train_model = None
+        self._multiplicative_component_names = None
 
         # set during prediction
         self.future_periods = None
@@ -391,7 +457,7 @@ class NeuralProphet:
         for name in names:
             self._validate_column_name(name)
             if self.config_covar is None:
-                self.config_covar = OrderedDict({})
+                self.config_covar = {}
             self.config_covar[name] = configure.Covar(
                 reg_lambda=regularization,
                 normalize=normalize,
@@ -457,7 +523,7 @@ class NeuralProphet:
             raise Exception("Events must be added prior to model fitting.")
 
         if self.events_config is None:
-            self.events_config = OrderedDict({})
+            self.events_config = {}
 
         if regularization is not None:
             if regularization < 0:
@@ -575,7 +641,7 @@ class NeuralProphet:
                 metrics with training and potentially evaluation metrics
         """
 
-        df_dict, _ = df_utils.prep_copy_df_dict(df)
+        df_dict, _ = df_utils.as_df_dict(df)
         if self.fitted is True:
             log.error("Model has already been fitted. Re-fitting may break or produce different results.")
         df_dict = self._check_dataframe(df_dict, check_y=True, exogenous=True)
@@ -584,22 +650,23 @@ class NeuralProphet:
         if validation_df is not None and (self.metrics is None or minimal):
             log.warning("Ignoring validation_df because no metrics set or minimal training set.")
             validation_df = None
-        if validation_df is None:
-            if minimal:
-                self._train_minimal(df_dict, progress_bar=progress == "bar")
-                metrics_df = None
+        with utils_torch.fast_cuda_math(self.config_train.device, allow_tf32=self.config_train.allow_tf32):
+            if validation_df is None:
+                if minimal:
+                    self._train_minimal(df_dict, progress_bar=progress == "bar")
+                    metrics_df = None
+                else:
+                    metrics_df = self._train(df_dict, progress=progress)
             else:
-                metrics_df = self._train(df_dict, progress=progress)
-        else:
-            df_val_dict, _ = df_utils.prep_copy_df_dict(validation_df)
-            df_val_dict = self._check_dataframe(df_val_dict, check_y=False, exogenous=False)
-            df_val_dict = self._handle_missing_data(df_val_dict, freq=self.data_freq)
-            metrics_df = self._train(df_dict, df_val_dict=df_val_dict, progress=progress)
+                df_val_dict, _ = df_utils.as_df_dict(validation_df)
+                df_val_dict = self._check_dataframe(df_val_dict, check_y=False, exogenous=False)
+                df_val_dict = self._handle_missing_data(df_val_dict, freq=self.data_freq)
+                metrics_df = self._train(df_dict, df_val_dict=df_val_dict, progress=progress)
 
         self.fitted = True
         return metrics_df
 
-    def predict(self, df, decompose=True, raw=False):
+    def predict(self, df, decompose=True, raw=False, batch_size=None):
         """Runs the model to make predictions.
 
         Expects all data needed to be present in dataframe.
@@ -618,6 +685,9 @@ class NeuralProphet:
                 Options
                     * (default) ``False``: returns forecasts sorted by target (highlighting forecast age)
                     * ``True``: return the raw forecasts sorted by forecast start date
+            batch_size : int
+                number of samples run through the model at once,
+                defaults to the larger of 4096 and 4x the training batch size
 
         Returns
         -------
@@ -639,14 +709,15 @@ class NeuralProphet:
             log.warning("Raw forecasts are incompatible with plotting utilities")
         if self.fitted is False:
             raise ValueError("Model has not been fitted. Predictions will be random.")
-        df_dict, received_unnamed_df = df_utils.prep_copy_df_dict(df)
+        df_dict, received_unnamed_df = df_utils.as_df_dict(df)
         # to get all forecasteable values with df given, maybe extend into future:
         df_dict, periods_added = self._maybe_extend_df(df_dict)
         df_dict = self._prepare_dataframe_to_predict(df_dict)
         # normalize
         df_dict = self._normalize(df_dict)
+        raw_predictions = self._predict_raw(df_dict, include_components=decompose, batch_size=batch_size)
         for key, df_i in df_dict.items():
-            dates, predicted, components = self._predict_raw(df_i, key, include_components=decompose)
+            dates, predicted, components = raw_predictions[key]
             if raw:
                 fcst = self._convert_raw_predictions_to_raw_df(dates, predicted, components)
                 if periods_added[key] > 0:
@@ -671,7 +742,7 @@ class NeuralProphet:
             pd.DataFrame
                 evaluation metrics
         """
-        df_dict, received_unnamed_df = df_utils.prep_copy_df_dict(df)
+        df_dict, received_unnamed_df = df_utils.as_df_dict(df)
         if self.fitted is False:
             log.warning("Model has not been fitted. Test results will be random.")
         df_dict = self._check_dataframe(df_dict, check_y=True, exogenous=True)
@@ -800,7 +871,7 @@ class NeuralProphet:
             'data3':           ds    y
             0 2022-12-13  8.3}
         """
-        df, received_unnamed_df = df_utils.prep_copy_df_dict(df)
+        df, received_unnamed_df = df_utils.as_df_dict(df)
         df = self._check_dataframe(df, check_y=False, exogenous=False)
         freq = df_utils.infer_frequency(df, n_lags=self.n_lags, freq=freq)
         df = self._handle_missing_data(df, freq=freq, predicting=False)
@@ -846,7 +917,6 @@ class NeuralProphet:
         """
         if isinstance(df, dict):
             raise NotImplementedError("Crossvalidation not implemented for multiple dataframes")
-        df = df.copy(deep=True)
         df = self._check_dataframe(df, check_y=False, exogenous=False)
         freq = df_utils.infer_frequency(df, n_lags=self.n_lags, freq=freq)
         df = self._handle_missing_data(df, freq=freq, predicting=False)
@@ -887,7 +957,6 @@ class NeuralProphet:
         """
         if isinstance(df, dict):
             raise NotImplementedError("Double crossvalidation not implemented for multiple dataframes")
-        df = df.copy(deep=True)
         df = self._check_dataframe(df, check_y=False, exogenous=False)
         freq = df_utils.infer_frequency(df, n_lags=self.n_lags, freq=freq)
         df = self._handle_missing_data(df, freq=freq, predicting=False)
@@ -923,15 +992,16 @@ class NeuralProphet:
                 "The events configs should be added to the NeuralProphet object (add_events fn)"
                 "before creating the data with events features"
             )
-        df_dict, received_unnamed_df = df_utils.prep_copy_df_dict(df)
+        df_dict, received_unnamed_df = df_utils.as_df_dict(df)
         df_dict = self._check_dataframe(df_dict, check_y=True, exogenous=False)
+        valid_events = frozenset(self.events_config)
         if isinstance(events_df, pd.DataFrame):
             events_df_i = events_df.copy(deep=True)
+            assert set(events_df_i["event"].unique()) <= valid_events
         for df_name, df_i in df_dict.items():
             if isinstance(events_df, dict):
                 events_df_i = events_df[df_name].copy(deep=True)
-            for name in events_df_i["event"].unique():
-                assert name in self.events_config
+                assert set(events_df_i["event"].unique()) <= valid_events
             df_out = df_utils.convert_events_to_features(
                 df_i,
                 events_config=self.events_config,
@@ -942,9 +1012,9 @@ class NeuralProphet:
         return df
 
     def make_future_dataframe(self, df, events_df=None, regressors_df=None, periods=None, n_historic_predictions=False):
-        df_dict, received_unnamed_df = df_utils.prep_copy_df_dict(df)
-        df_dict_events, received_unnamed_events_df = df_utils.prep_copy_df_dict(events_df)
-        df_dict_regressors, received_unnamed_regressors_df = df_utils.prep_copy_df_dict(regressors_df)
+        df_dict, received_unnamed_df = df_utils.as_df_dict(df)
+        df_dict_events, received_unnamed_events_df = df_utils.as_df_dict(events_df)
+        df_dict_regressors, received_unnamed_regressors_df = df_utils.as_df_dict(regressors_df)
         if received_unnamed_events_df:
             df_dict_events = {key: df_dict_events["__df__"] for key in df_dict.keys()}
         elif df_dict_events is None:
@@ -958,15 +1028,16 @@ class NeuralProphet:
         else:
             df_utils.compare_dict_keys(df_dict, df_dict_regressors, "dataframes", "regressors")
 
-        df_future_dataframe = {}
-        for key in df_dict.keys():
-            df_future_dataframe[key] = self._make_future_dataframe(
-                df=df_dict[key],
+        df_future_dataframe = {
+            key: self._make_future_dataframe(
+                df=df_i,
                 events_df=df_dict_events[key],
                 regressors_df=df_dict_regressors[key],
                 periods=periods,
                 n_historic_predictions=n_historic_predictions,
             )
+            for key, df_i in df_dict.items()
+        }
         df_future = df_utils.maybe_get_single_df_from_df_dict(df_future_dataframe, received_unnamed_df)
         return df_future
 
@@ -983,15 +1054,22 @@ class NeuralProphet:
             pd.DataFrame, dict
                 trend on prediction dates.
         """
-        df_dict, received_unnamed_df = df_utils.prep_copy_df_dict(df)
+        df_dict, received_unnamed_df = df_utils.as_df_dict(df)
         df_dict = self._check_dataframe(df_dict, check_y=False, exogenous=False)
         df_dict = self._normalize(df_dict)
-        for df_name, df in df_dict.items():
-            t = torch.from_numpy(np.expand_dims(df["t"].values, 1))
-            trend = self.model.trend(t).squeeze().detach().numpy()
-            data_params = self.config_normalization.get_data_params(df_name)
-            trend = trend * data_params["y"].scale + data_params["y"].shift
-            df_dict[df_name] = pd.DataFrame({"ds": df["ds"], "trend": trend})
+        # evaluate the trend of all series at once
+        lengths = [len(df) for df in df_dict.values()]
+        # write each series' time into one float32 buffer, instead of concatenating and then casting a copy
+        t = np.empty((sum(lengths), 1), dtype=np.float32)
+        for df_i, start, length in zip(df_dict.values(), np.cumsum([0] + lengths), lengths):
+            t[start : start + length, 0] = df_i["t"].to_numpy()
+        t = torch.from_numpy(t).to(self.config_train.device)
+        with utils_torch.inference_mode():
+            trend = self.model.trend(t).reshape(-1).cpu().numpy()
+        scale_shift = np.repeat(self.config_normalization.get_y_scale_shift(df_dict.keys()), lengths, axis=0)
+        trend = np.split(trend * scale_shift[:, 0] + scale_shift[:, 1], np.cumsum(lengths)[:-1])
+        for (df_name, df), trend_i in zip(df_dict.items(), trend):
+            df_dict[df_name] = pd.DataFrame({"ds": df["ds"], "trend": trend_i})
         df = df_utils.maybe_get_single_df_from_df_dict(df_dict, received_unnamed_df)
         return df
 
@@ -1008,34 +1086,47 @@ class NeuralProphet:
             pd.DataFrame, dict
                 seasonal components with columns of name <seasonality component name>
         """
-        df_dict, received_unnamed_df = df_utils.prep_copy_df_dict(df)
+        df_dict, received_unnamed_df = df_utils.as_df_dict(df)
         df_dict = self._check_dataframe(df_dict, check_y=False, exogenous=False)
         df_dict = self._normalize(df_dict)
-        for df_name, df in df_dict.items():
-            dataset = time_dataset.TimeDataset(
-                df,
-                name=df_name,
-                season_config=self.season_config,
-                # n_lags=0,
-                # n_forecasts=1,
-                predict_mode=True,
-            )
-            loader = DataLoader(dataset, batch_size=min(4096, len(df)), shuffle=False, drop_last=False)
-            predicted = {}
-            for name in self.season_config.periods:
-                predicted[name] = list()
+        # seasonality features of all series in one dataset
+        dataset = time_dataset.GlobalTimeDataset(
+            df_dict,
+            season_config=self.season_config,
+            predict_mode=True,
+        )
+        loader = time_dataset.make_batch_loader(
+            dataset,
+            batch_size=min(4096, len(dataset)),
+            shuffle=False,
+            drop_last=False,
+            **self.config_train.get_loader_kwargs(persistent=False),
+        )
+        # batches are written into buffers on the device, moved to the host once all batches are done
+        predicted = {}
+        start = 0
+        with utils_torch.inference_mode():
             for inputs, _, _ in loader:
-                for name in self.season_config.periods:
-                    features = inputs["seasonalities"][name]
-                    y_season = torch.squeeze(self.model.seasonality(features=features, name=name))
-                    predicted[name].append(y_season.data.numpy())
-
-            for name in self.season_config.periods:
-                predicted[name] = np.concatenate(predicted[name])
-                if self.season_config.mode == "additive":
-                    data_params = self.config_normalization.get_data_params(df_name)
-                    predicted[name] = predicted[name] * data_params["y"].scale
-            df_dict[df_name] = pd.DataFrame({"ds": df["ds"], **predicted})
+                end = start + inputs["time"].shape[0]
+                for name, features in inputs["seasonalities"].items():
+                    features = features.to(self.config_train.device, non_blocking=True)
+                    y_season = self.model.seasonality(features=features, name=name).reshape(-1)
+                    if name not in predicted:
+                        predicted[name] = y_season.new_empty(len(dataset))
+                    predicted[name][start:end] = y_season
+                start = end
+        predicted = utils_torch.to_numpy(predicted)
+
+        split_idx = np.cumsum(dataset.lengths)[:-1]
+        if self.season_config.mode == "additive":
+            # scale in place and in float32, the dtype of the model output
+            scale = self.config_normalization.get_y_scale_shift(df_dict.keys())[:, 0].astype(np.float32)
+            scale = scale[0] if (scale == scale[0]).all() else np.repeat(scale, dataset.lengths)
+            for values in predicted.values():
+                values *= scale
+        predicted = {name: np.split(values, split_idx) for name, values in predicted.items()}
+        for i, (df_name, df) in enumerate(df_dict.items()):
+            df_dict[df_name] = pd.DataFrame({"ds": df["ds"], **{name: values[i] for name, values in predicted.items()}})
         df = df_utils.maybe_get_single_df_from_df_dict(df_dict, received_unnamed_df)
         return df
 
@@ -1078,10 +1169,12 @@ class NeuralProphet:
             figsize : tuple
                 width, height in inches. default: (10, 6)
         """
+        from neuralprophet.plot_forecast import plot
+
         if isinstance(fcst, dict):
             log.error("Receiced more than one DataFrame. Use a for loop for many dataframes.")
         if self.n_lags > 0:
-            num_forecasts = sum(fcst["yhat1"].notna())
+            num_forecasts = int(fcst["yhat1"].notna().sum())
             if num_forecasts < self.n_forecasts:
                 log.warning(
                     "Too few forecasts to plot a line per forecast step." "Plotting a line per forecast origin instead."
@@ -1137,6 +1230,8 @@ class NeuralProphet:
             matplotlib.axes.Axes
                 plot of NeuralProphet forecasting
         """
+        from neuralprophet.plot_forecast import plot
+
         if self.n_lags == 0:
             raise ValueError("Use the standard plot function for models without lags.")
         if isinstance(fcst, dict):
@@ -1177,6 +1272,8 @@ class NeuralProphet:
             matplotlib.axes.Axes
                 plot of NeuralProphet components
         """
+        from neuralprophet.plot_forecast import plot_components
+
         if isinstance(fcst, dict):
             log.error("Receiced more than one DataFrame. Use a for loop for many dataframes.")
         return plot_components(
@@ -1218,6 +1315,8 @@ class NeuralProphet:
             matplotlib.axes.Axes
                 plot of NeuralProphet forecasting
         """
+        from neuralprophet.plot_model_parameters import plot_parameters
+
         return plot_parameters(
             m=self,
             forecast_in_focus=self.highlight_forecast_step_n,
@@ -1245,7 +1344,7 @@ class NeuralProphet:
             n_lags=self.n_lags,
             num_hidden_layers=self.config_model.num_hidden_layers,
             d_hidden=self.config_model.d_hidden,
-        )
+        ).to(self.config_train.device)
         log.debug(self.model)
         return self.model
 
@@ -1308,7 +1407,7 @@ class NeuralProphet:
         """
         if self.n_lags == 0 and not predicting:
             # we can drop rows with NA in y
-            sum_na = sum(df["y"].isna())
+            sum_na = int(df["y"].isna().sum())
             if sum_na > 0:
                 df = df[df["y"].notna()]
                 log.info("dropped {} NAN row in 'y'".format(sum_na))
@@ -1329,21 +1428,14 @@ class NeuralProphet:
         if self.regressors_config is not None:
             # if future regressors, check that they are not nan at end, else drop
             # we ignore missing events, as those will be filled in with zeros.
-            reg_nan_at_end = 0
-            for col in self.regressors_config.keys():
-                col_nan_at_end = 0
-                while len(df) > col_nan_at_end and df[col].isnull().iloc[-(1 + col_nan_at_end)]:
-                    col_nan_at_end += 1
-                reg_nan_at_end = max(reg_nan_at_end, col_nan_at_end)
+            reg_nan_at_end = df_utils.count_nans_at_end(df[list(self.regressors_config.keys())])
             if reg_nan_at_end > 0:
                 # drop rows at end due to missing future regressors
                 df = df[:-reg_nan_at_end]
                 log.info("Dropped {} rows at end due to missing future regressor values.".format(reg_nan_at_end))
 
         df_end_to_append = None
-        nan_at_end = 0
-        while len(df) > nan_at_end and df["y"].isnull().iloc[-(1 + nan_at_end)]:
-            nan_at_end += 1
+        nan_at_end = df_utils.count_nans_at_end(df["y"])
         if nan_at_end > 0:
             if predicting:
                 # allow nans at end - will re-add at end
@@ -1376,34 +1468,40 @@ class NeuralProphet:
             data_columns.extend(self.regressors_config.keys())
         if self.events_config is not None:
             data_columns.extend(self.events_config.keys())
-        for column in data_columns:
-            sum_na = sum(df[column].isnull())
-            if sum_na > 0:
-                if self.impute_missing:
-                    # use 0 substitution for holidays and events missing values
-                    if self.events_config is not None and column in self.events_config.keys():
-                        df[column].fillna(0, inplace=True)
-                        remaining_na = 0
-                    else:
-                        df.loc[:, column], remaining_na = df_utils.fill_linear_then_rolling_avg(
-                            df[column],
-                            limit_linear=self.impute_limit_linear,
-                            rolling=self.impute_rolling,
-                        )
-                    log.info("{} NaN values in column {} were auto-imputed.".format(sum_na - remaining_na, column))
-                    if remaining_na > 0:
-                        raise ValueError(
-                            "More than {} consecutive missing values encountered in column {}. "
-                            "{} NA remain. Please preprocess data manually.".format(
-                                2 * self.impute_limit_linear + self.impute_rolling, column, remaining_na
-                            )
-                        )
-                else:  # fail because set to not impute missing
+        sum_na = df[data_columns].isnull().sum()
+        na_columns = sum_na.index[sum_na > 0].tolist()
+        if len(na_columns) > 0:
+            if not self.impute_missing:  # fail because set to not impute missing
+                raise ValueError(
+                    "Missing values found. " "Please preprocess data manually or set impute_missing to True."
+                )
+            # use 0 substitution for holidays and events missing values
+            event_columns = [c for c in na_columns if self.events_config is not None and c in self.events_config]
+            fill_columns = [c for c in na_columns if c not in event_columns]
+            remaining_na = pd.Series(0, index=na_columns)
+            if len(event_columns) > 0:
+                df[event_columns] = df[event_columns].fillna(0)
+            if len(fill_columns) > 0:
+                df[fill_columns], remaining_na[fill_columns] = df_utils.fill_linear_then_rolling_avg(
+                    df[fill_columns],
+                    limit_linear=self.impute_limit_linear,
+                    rolling=self.impute_rolling,
+                )
+            for column in na_columns:
+                log.info(
+                    "{} NaN values in column {} were auto-imputed.".format(
+                        sum_na[column] - remaining_na[column], column
+                    )
+                )
+                if remaining_na[column] > 0:
                     raise ValueError(
-                        "Missing values found. " "Please preprocess data manually or set impute_missing to True."
+                        "More than {} consecutive missing values encountered in column {}. "
+                        "{} NA remain. Please preprocess data manually.".format(
+                            2 * self.impute_limit_linear + self.impute_rolling, column, remaining_na[column]
+                        )
                     )
         if df_end_to_append is not None:
-            df = df.append(df_end_to_append)
+            df = pd.concat([df, df_end_to_append], copy=False)
         return df
 
     def _handle_missing_data(self, df, freq, predicting=False):
@@ -1467,15 +1565,16 @@ class NeuralProphet:
             df = {"__df__": df}
         elif not isinstance(df, dict):
             raise ValueError("Please insert valid df type (i.e. pd.DataFrame, dict)")
-        checked_df = {}
-        for key, df_i in df.items():
-            checked_df[key] = df_utils.check_single_dataframe(
+        checked_df = {
+            key: df_utils.check_single_dataframe(
                 df=df_i,
                 check_y=check_y,
                 covariates=self.config_covar if exogenous else None,
                 regressors=self.regressors_config if exogenous else None,
                 events=self.events_config if exogenous else None,
             )
+            for key, df_i in df.items()
+        }
         if not df_is_dict:
             checked_df = checked_df["__df__"]
         return checked_df
@@ -1494,26 +1593,7 @@ class NeuralProphet:
             regressors : bool
                 check if name already used for regressor
         """
-        reserved_names = [
-            "trend",
-            "additive_terms",
-            "daily",
-            "weekly",
-            "yearly",
-            "events",
-            "holidays",
-            "zeros",
-            "extra_regressors_additive",
-            "yhat",
-            "extra_regressors_multiplicative",
-            "multiplicative_terms",
-        ]
-        rn_l = [n + "_lower" for n in reserved_names]
-        rn_u = [n + "_upper" for n in reserved_names]
-        reserved_names.extend(rn_l)
-        reserved_names.extend(rn_u)
-        reserved_names.extend(["ds", "y", "cap", "floor", "y_scaled", "cap_scaled"])
-        if name in reserved_names:
+        if name in RESERVED_NAMES:
             raise ValueError("Name {name!r} is reserved.".format(name=name))
         if events and self.events_config is not None:
             if name in self.events_config.keys():
@@ -1549,10 +1629,8 @@ class NeuralProphet:
         -------
             df_dict: dict of pd.DataFrame, normalized
         """
-        for df_name, df_i in df_dict.items():
-            data_params = self.config_normalization.get_data_params(df_name)
-            df_dict[df_name] = df_utils.normalize(df_i, data_params)
-        return df_dict
+        get_data_params = self.config_normalization.get_data_params
+        return {df_name: df_utils.normalize(df_i, get_data_params(df_name)) for df_name, df_i in df_dict.items()}
 
     def _init_train_loader(self, df_dict):
         """Executes data preparation steps and initiates training procedure.
@@ -1580,13 +1658,15 @@ class NeuralProphet:
         # if not self.fitted:
         if self.config_trend.changepoints is not None:
             # scale user-specified changepoint times
-            self.config_trend.changepoints = self._normalize(
-                {"__df__": pd.DataFrame({"ds": pd.Series(self.config_trend.changepoints)})}
-            )["__df__"]["t"].values
+            self.config_trend.changepoints = df_utils.normalize_ds_array(
+                self.config_trend.changepoints, self.config_normalization.get_data_params("__df__")
+            )
 
         df_merged, _ = df_utils.join_dataframes(df_dict)
-        df_merged = df_merged.sort_values("ds")
-        df_merged.drop_duplicates(inplace=True, keep="first", subset=["ds"])
+        # deduplicate before sorting so fewer rows are moved; stable sort keeps the first occurrence
+        df_merged = df_merged.drop_duplicates(subset=["ds"], keep="first").sort_values(
+            "ds", kind="mergesort", ignore_index=True
+        )
 
         self.season_config = utils.set_auto_seasonalities(df_merged, season_config=self.season_config)
         if self.country_holidays_config is not None:
@@ -1595,25 +1675,37 @@ class NeuralProphet:
         dataset = self._create_dataset(df_dict, predict_mode=False)  # needs to be called after set_auto_seasonalities
         self.config_train.set_auto_batch_epoch(n_data=len(dataset))
 
-        loader = DataLoader(dataset, batch_size=self.config_train.batch_size, shuffle=True)
+        loader = time_dataset.make_batch_loader(
+            dataset, batch_size=self.config_train.batch_size, shuffle=True, **self.config_train.get_loader_kwargs()
+        )
 
         # if not self.fitted:
         self.model = self._init_model()  # needs to be called after set_auto_seasonalities
+        self._multiplicative_component_names = None
 
         if self.config_train.learning_rate is None:
             self.config_train.learning_rate = self.config_train.find_learning_rate(self.model, dataset)
             log.info("lr-range-test selected learning rate: {:.2E}".format(self.config_train.learning_rate))
+        self._train_model = self.model
+        if self.config_train.compile_model:
+            inputs, _, _ = dataset[list(range(min(self.config_train.batch_size, len(dataset))))]
+            inputs = utils_torch.to_device(inputs, self.config_train.device)
+            with self.config_train.get_autocast():
+                self._train_model = utils_torch.compile_model(self.model, example_inputs=inputs)
         self.optimizer = self.config_train.get_optimizer(self.model.parameters())
         self.scheduler = self.config_train.get_scheduler(self.optimizer, steps_per_epoch=len(loader))
+        self.grad_scaler = self.config_train.get_grad_scaler()
         return loader
 
-    def _init_val_loader(self, df_dict):
+    def _init_val_loader(self, df_dict, eval_batch_size=None):
         """Executes data preparation steps and initiates evaluation procedure.
 
         Parameters
         ----------
             df : pd.DataFrame, dict
                 dataframe or dict of dataframes containing column ``ds``, ``y`` with all data
+            eval_batch_size : int
+                number of samples per evaluation batch, defaults to the larger of 4096 and 4x the training batch size
 
         Returns
         -------
@@ -1621,23 +1713,23 @@ class NeuralProphet:
         """
         df_dict = self._normalize(df_dict)
         dataset = self._create_dataset(df_dict, predict_mode=False)
-        loader = DataLoader(dataset, batch_size=min(1024, len(dataset)), shuffle=False, drop_last=False)
+        if eval_batch_size is None:
+            eval_batch_size = self.config_train.eval_batch_size
+        loader = time_dataset.make_batch_loader(
+            dataset,
+            batch_size=min(eval_batch_size, len(dataset)),
+            shuffle=False,
+            drop_last=False,
+            **self.config_train.get_loader_kwargs(),
+        )
         return loader
 
     def _get_time_based_sample_weight(self, t):
-        weight = torch.ones_like(t)
-        if self.config_train.newer_samples_weight > 1.0:
-            end_w = self.config_train.newer_samples_weight
-            start_t = self.config_train.newer_samples_start
-            time = (t.detach() - start_t) / (1.0 - start_t)
-            time = torch.maximum(torch.zeros_like(time), time)
-            time = torch.minimum(torch.ones_like(time), time)  # time = 0 to 1
-            time = np.pi * (time - 1.0)  # time =  -pi to 0
-            time = 0.5 * torch.cos(time) + 0.5  # time =  0 to 1
-            # scales end to be end weight times bigger than start weight
-            # with end weight being 1.0
-            weight = (1.0 + time * (end_w - 1.0)) / end_w
-        return weight
+        end_w = self.config_train.newer_samples_weight
+        if end_w <= 1.0:
+            # uniform weighting, broadcast as scalar without allocating a ones tensor
+            return 1.0
+        return utils.time_based_sample_weight(t.detach(), end_w, self.config_train.newer_samples_start)
 
     def _train_epoch(self, e, loader):
         """Make one complete iteration over all samples in dataloader and update model after each batch.
@@ -1650,30 +1742,91 @@ class NeuralProphet:
                 Training Dataloader
         """
         self.model.train()
+        # resolve per-epoch constants once instead of on every batch
+        inv_n_batches = 1.0 / len(loader)
+        device = self.config_train.device
+        loss_func = self.config_train.loss_func
+        batch_metrics = self.metrics
+        reg_terms = self._get_regularization_terms()
         for i, (inputs, targets, meta) in enumerate(loader):
-            # Run forward calculation
-            predicted = self.model.forward(inputs)
-            # Compute loss. no reduction.
-            loss = self.config_train.loss_func(predicted, targets)
+            inputs = utils_torch.to_device(inputs, device, non_blocking=True)
+            targets = targets.to(device, non_blocking=True)
+            with self.config_train.get_autocast():
+                # Run forward calculation
+                predicted = self._train_model(inputs)
+                # Compute loss. no reduction.
+                loss = loss_func(predicted, targets)
+            # continue in full precision
+            predicted, loss = predicted.float(), loss.float()
             # Weigh newer samples more.
             loss = loss * self._get_time_based_sample_weight(t=inputs["time"])
             loss = loss.mean()
             # Regularize.
-            loss, reg_loss = self._add_batch_regualarizations(loss, e, i / float(len(loader)))
+            loss, reg_loss = self._add_batch_regualarizations(loss, e, i * inv_n_batches, reg_terms)
             self.optimizer.zero_grad()
-            loss.backward()
-            self.optimizer.step()
+            if self.grad_scaler is None:
+                loss.backward()
+                self.optimizer.step()
+            else:
+                # scale the loss against float16 gradient underflow, skips steps with inf/nan gradients
+                self.grad_scaler.scale(loss).backward()
+                self.grad_scaler.step(self.optimizer)
+                self.grad_scaler.update()
             self.scheduler.step()
-            if self.metrics is not None:
-                self.metrics.update(
+            if batch_metrics is not None:
+                batch_metrics.update(
                     predicted=predicted.detach(), target=targets.detach(), values={"Loss": loss, "RegLoss": reg_loss}
                 )
-        if self.metrics is not None:
-            return self.metrics.compute(save=True)
+        if batch_metrics is not None:
+            return batch_metrics.compute(save=True)
         else:
             return None
 
-    def _add_batch_regualarizations(self, loss, e, iter_progress):
+    def _get_regularization_terms(self):
+        """Collect the regularization terms enabled by the configuration.
+
+        Resolving which terms apply once, rather than per batch, keeps config lookups out of the training loop.
+        The penalties themselves are computed when called, as the weights change with every optimizer step.
+
+        Returns
+        -------
+            list of callable
+                functions without arguments, each returning a weighted scalar penalty tensor
+        """
+        terms = []
+        # Add regularization of AR weights - sparsify
+        l_ar = self.config_ar.reg_lambda
+        if self.model.n_lags > 0 and l_ar is not None:
+            l_ar = l_ar / self.n_forecasts
+            terms.append(lambda: l_ar * self.config_ar.regularize(self.model.ar_weights).sum())
+
+        # Regularize trend to be smoother/sparse
+        l_trend = self.config_trend.trend_reg
+        if self.config_trend.n_changepoints > 0 and l_trend is not None and l_trend > 0:
+            threshold = self.config_train.trend_reg_threshold
+            terms.append(lambda: l_trend * utils.reg_func_trend(self.model.get_trend_deltas, threshold=threshold))
+
+        # Regularize seasonality: sparsify fourier term coefficients
+        l_season = self.config_train.reg_lambda_season
+        if self.model.season_dims is not None and l_season is not None and l_season > 0:
+            season_params = list(self.model.season_params.values())
+            terms.append(lambda: l_season * torch.stack([utils.reg_func_season(p) for p in season_params]).sum())
+
+        # Regularize events: sparsify events features coefficients
+        events_lambdas = [] if self.events_config is None else [c.reg_lambda for c in self.events_config.values()]
+        if self.country_holidays_config is not None:
+            events_lambdas.append(self.country_holidays_config.reg_lambda)
+        if any(reg_lambda is not None for reg_lambda in events_lambdas):
+            terms.append(lambda: utils.reg_func_events(self.events_config, self.country_holidays_config, self.model))
+
+        # Regularize regressors: sparsify regressor features coefficients
+        if self.regressors_config is not None and any(
+            c.reg_lambda is not None for c in self.regressors_config.values()
+        ):
+            terms.append(lambda: utils.reg_func_regressors(self.regressors_config, self.model))
+        return terms
+
+    def _add_batch_regualarizations(self, loss, e, iter_progress, reg_terms=None):
         """Add regulatization terms to loss, if applicable
 
         Parameters
@@ -1684,48 +1837,23 @@ class NeuralProphet:
                 current epoch number
             iter_progress : float
                 this epoch's progress of iterating over dataset [0, 1]
+            reg_terms : list of callable
+                regularization terms as returned by ``_get_regularization_terms``, collected if not provided
 
         Returns
         -------
             loss, reg_loss
         """
         delay_weight = self.config_train.get_reg_delay_weight(e, iter_progress)
-
-        reg_loss = torch.zeros(1, dtype=torch.float, requires_grad=False)
-        if delay_weight > 0:
-            # Add regularization of AR weights - sparsify
-            if self.model.n_lags > 0 and self.config_ar.reg_lambda is not None:
-                reg_ar = self.config_ar.regularize(self.model.ar_weights)
-                reg_ar = torch.sum(reg_ar).squeeze() / self.n_forecasts
-                reg_loss += self.config_ar.reg_lambda * reg_ar
-
-            # Regularize trend to be smoother/sparse
-            l_trend = self.config_trend.trend_reg
-            if self.config_trend.n_changepoints > 0 and l_trend is not None and l_trend > 0:
-                reg_trend = utils.reg_func_trend(
-                    weights=self.model.get_trend_deltas,
-                    threshold=self.config_train.trend_reg_threshold,
-                )
-                reg_loss += l_trend * reg_trend
-
-            # Regularize seasonality: sparsify fourier term coefficients
-            l_season = self.config_train.reg_lambda_season
-            if self.model.season_dims is not None and l_season is not None and l_season > 0:
-                for name in self.model.season_params.keys():
-                    reg_season = utils.reg_func_season(self.model.season_params[name])
-                    reg_loss += l_season * reg_season
-
-            # Regularize events: sparsify events features coefficients
-            if self.events_config is not None or self.country_holidays_config is not None:
-                reg_events_loss = utils.reg_func_events(self.events_config, self.country_holidays_config, self.model)
-                reg_loss += reg_events_loss
-
-            # Regularize regressors: sparsify regressor features coefficients
-            if self.regressors_config is not None:
-                reg_regressor_loss = utils.reg_func_regressors(self.regressors_config, self.model)
-                reg_loss += reg_regressor_loss
-
-        reg_loss = delay_weight * reg_loss
+        if delay_weight <= 0:
+            # regularization not yet active, leave loss untouched
+            return loss, torch.zeros((), dtype=loss.dtype, device=loss.device)
+        if reg_terms is None:
+            reg_terms = self._get_regularization_terms()
+        if not reg_terms:
+            return loss, torch.zeros((), dtype=loss.dtype, device=loss.device)
+        # reduce all terms at once instead of accumulating in place
+        reg_loss = delay_weight * torch.stack([term() for term in reg_terms]).sum()
         loss = loss + reg_loss
         return loss, reg_loss
 
@@ -1734,20 +1862,22 @@ class NeuralProphet:
 
         Parameters
         ----------
-            loader : torch DataLoader
-                instantiated Validation Dataloader (with TimeDataset)
+            loader : torch DataLoader, list
+                instantiated Validation Dataloader (with TimeDataset) or its already collated batches
             val_metrics : MetricsCollection
-                alidation metrics to be computed.
+                validation metrics to be computed.
 
         Returns
         -------
             dict with evaluation metrics
         """
-        with torch.no_grad():
+        with utils_torch.inference_mode():
             self.model.eval()
             for inputs, targets, meta in loader:
-                predicted = self.model.forward(inputs)
-                val_metrics.update(predicted=predicted.detach(), target=targets.detach())
+                inputs = utils_torch.to_device(inputs, self.config_train.device, non_blocking=True)
+                targets = targets.to(self.config_train.device, non_blocking=True)
+                predicted = self.model(inputs)
+                val_metrics.update(predicted=predicted, target=targets)
             val_metrics = val_metrics.compute(save=True)
         return val_metrics
 
@@ -1820,7 +1950,8 @@ class NeuralProphet:
 
         validate = df_val_dict is not None
         if validate:
-            val_loader = self._init_val_loader(df_val_dict)
+            # the validation set does not change between epochs: collate its batches once
+            val_loader = list(self._init_val_loader(df_val_dict))
             val_metrics = metrics.MetricsCollection([m.new() for m in self.metrics.batch_metrics])
 
         # set up printing and plotting
@@ -1847,6 +1978,7 @@ class NeuralProphet:
                 range(self.config_train.epochs),
                 total=self.config_train.epochs,
                 leave=log.getEffectiveLevel() <= 20,
+                mininterval=0.5,
             )
         else:
             training_loop = range(self.config_train.epochs)
@@ -1854,7 +1986,7 @@ class NeuralProphet:
         start = time.time()
         # run training loop
         for e in training_loop:
-            metrics_live = OrderedDict({})
+            metrics_live = {}
             self.metrics.reset()
             if validate:
                 val_metrics.reset()
@@ -1866,11 +1998,12 @@ class NeuralProphet:
                 print_val_epoch_metrics = {k + "_val": v for k, v in val_epoch_metrics.items()}
             else:
                 val_epoch_metrics = None
-                print_val_epoch_metrics = OrderedDict({})
+                print_val_epoch_metrics = {}
             # print metrics
             if progress_bar:
-                training_loop.set_description(f"Epoch[{(e+1)}/{self.config_train.epochs}]")
-                training_loop.set_postfix(ordered_dict=epoch_metrics, **print_val_epoch_metrics)
+                # redrawn by tqdm at most every mininterval, not on every epoch
+                training_loop.set_description(f"Epoch[{(e+1)}/{self.config_train.epochs}]", refresh=False)
+                training_loop.set_postfix(ordered_dict=epoch_metrics, refresh=False, **print_val_epoch_metrics)
             elif progress_print:
                 metrics_string = utils.print_epoch_metrics(epoch_metrics, e=e, val_metrics=val_epoch_metrics)
                 if e == 0:
@@ -1923,12 +2056,13 @@ class NeuralProphet:
                 range(self.config_train.epochs),
                 total=self.config_train.epochs,
                 leave=log.getEffectiveLevel() <= 20,
+                mininterval=0.5,
             )
         else:
             training_loop = range(self.config_train.epochs)
         for e in training_loop:
             if progress_bar:
-                training_loop.set_description(f"Epoch[{(e+1)}/{self.config_train.epochs}]")
+                training_loop.set_description(f"Epoch[{(e+1)}/{self.config_train.epochs}]", refresh=False)
             _ = self._train_epoch(e, loader)
 
     def _eval_true_ar(self):
@@ -1939,7 +2073,7 @@ class NeuralProphet:
             forecast_pos = 1
         else:
             forecast_pos = self.highlight_forecast_step_n
-        weights = self.model.ar_weights.detach().numpy()
+        weights = self.model.ar_weights.detach().cpu().numpy()
         weights = weights[forecast_pos - 1, :][::-1]
         sTPE = utils.symmetric_total_percentage_error(self.true_ar_weights, weights)
         log.info("AR parameters: ", self.true_ar_weights, "\n", "Model weights: ", weights)
@@ -1975,13 +2109,12 @@ class NeuralProphet:
             log.warning(
                 "Not extending df into future as no periods specified." "You can call predict directly instead."
             )
-        df = df.copy(deep=True)
         _ = df_utils.infer_frequency(df, n_lags=self.n_lags, freq=self.data_freq)
-        last_date = pd.to_datetime(df["ds"].copy(deep=True).dropna()).sort_values().max()
+        last_date = pd.to_datetime(df["ds"]).max()
         if events_df is not None:
-            events_df = events_df.copy(deep=True).reset_index(drop=True)
+            events_df = events_df.reset_index(drop=True)
         if regressors_df is not None:
-            regressors_df = regressors_df.copy(deep=True).reset_index(drop=True)
+            regressors_df = regressors_df.reset_index(drop=True)
         n_lags = 0 if self.n_lags is None else self.n_lags
         if periods is None:
             periods = 1 if n_lags == 0 else self.n_forecasts
@@ -2057,18 +2190,17 @@ class NeuralProphet:
                 regressors_df=regressors_df,
             )
             if len(df) > 0:
-                df = df.append(future_df)
+                df = pd.concat([df, future_df], ignore_index=True)
             else:
                 df = future_df
-        df.reset_index(drop=True, inplace=True)
+        else:
+            df = df.reset_index(drop=True)
         return df
 
     def _get_maybe_extend_periods(self, df):
         n_lags = 0 if self.n_lags is None else self.n_lags
         periods_add = 0
-        nan_at_end = 0
-        while len(df) > nan_at_end and df["y"].isnull().iloc[-(1 + nan_at_end)]:
-            nan_at_end += 1
+        nan_at_end = df_utils.count_nans_at_end(df["y"])
         if n_lags > 0:
             if self.regressors_config is None:
                 # if dataframe has already been extended into future,
@@ -2088,21 +2220,19 @@ class NeuralProphet:
             if periods_add[df_name] > 0:
                 # This does not include future regressors or events.
                 # periods should be 0 if those are configured.
-                last_date = pd.to_datetime(df["ds"].copy(deep=True)).sort_values().max()
+                last_date = pd.to_datetime(df["ds"]).max()
                 future_df = df_utils.make_future_df(
                     df_columns=df.columns,
                     last_date=last_date,
                     periods=periods_add[df_name],
                     freq=self.data_freq,
                 )
-                df = df.append(future_df)
-                df.reset_index(drop=True, inplace=True)
+                df = pd.concat([df, future_df], ignore_index=True)
             df_dict[df_name] = df
         return df_dict, periods_add
 
     def _prepare_dataframe_to_predict(self, df_dict):
         for df_name, df in df_dict.items():
-            df = df.copy(deep=True)
             _ = df_utils.infer_frequency(df, n_lags=self.n_lags, freq=self.data_freq)
             # check if received pre-processed df
             if "y_scaled" in df.columns or "t" in df.columns:
@@ -2125,88 +2255,158 @@ class NeuralProphet:
             df_dict[df_name] = df
         return df_dict
 
-    def _predict_raw(self, df, df_name, include_components=False):
+    def _predict_raw(self, df_dict, include_components=False, batch_size=None):
         """Runs the model to make predictions.
 
         Predictions are returned in raw vector format without decomposition.
         Predictions are given on a forecast origin basis, not on a target basis.
+        The samples of all dataframes are run through the model together and split up afterwards.
 
         Parameters
         ----------
-            df : pd.DataFrame, dict
-                dataframe or dict of dataframes containing column ``ds``, ``y`` with all data
-            df_name : str
-                name of the data params from which the current dataframe refers to (only in case of local_normalization)
+            df_dict : dict
+                dict of prepared and normalized dataframes containing column ``ds``, ``y`` with all data
             include_components : bool
                 whether to return individual components of forecast
+            batch_size : int
+                number of samples run through the model at once, defaults to ``config_train.eval_batch_size``
 
         Returns
         -------
-            pd.Series
-                timestamps referring to the start of the predictions.
-            np.array
-                array containing the forecasts
-            dict[np.array]
-                Dictionary of components containing an array of each components contribution to the forecast
+            dict
+                for each dataframe name a tuple of
+
+                pd.Series
+                    timestamps referring to the start of the predictions.
+                np.array
+                    array containing the forecasts
+                dict[np.array]
+                    Dictionary of components containing an array of each components contribution to the forecast
         """
-        if isinstance(df, dict):
-            raise ValueError("Receiced more than one DataFrame. Use a for loop for many dataframes.")
-        if "y_scaled" not in df.columns or "t" not in df.columns:
-            raise ValueError("Received unprepared dataframe to predict. " "Please call predict_dataframe_to_predict.")
-        dataset = self._create_dataset(df_dict={df_name: df}, predict_mode=True)
-        loader = DataLoader(dataset, batch_size=min(1024, len(df)), shuffle=False, drop_last=False)
-        if self.n_forecasts > 1:
-            dates = df["ds"].iloc[self.n_lags : -self.n_forecasts + 1]
-        else:
-            dates = df["ds"].iloc[self.n_lags :]
-        predicted_vectors = list()
-        component_vectors = None
-
-        with torch.no_grad():
+        if not isinstance(df_dict, dict):
+            raise ValueError("df_dict must be a dict of pd.DataFrames.")
+        for df in df_dict.values():
+            if "y_scaled" not in df.columns or "t" not in df.columns:
+                raise ValueError(
+                    "Received unprepared dataframe to predict. " "Please call predict_dataframe_to_predict."
+                )
+        dataset = self._create_dataset(df_dict, predict_mode=True)
+        if batch_size is None:
+            batch_size = self.config_train.eval_batch_size
+        elif batch_size < 1:
+            raise ValueError("batch_size must be a positive integer, got {}.".format(batch_size))
+        loader = time_dataset.make_batch_loader(
+            dataset,
+            batch_size=min(batch_size, len(dataset)),
+            shuffle=False,
+            drop_last=False,
+            **self.config_train.get_loader_kwargs(persistent=False),
+        )
+        # batches are written into buffers allocated once on the device, instead of being copied to the host
+        # one by one and concatenated at the end. Only the filled buffers are moved to the host.
+        n_samples = len(dataset)
+        predicted_all = None
+        components_all = None
+        offset = 0
+
+        with utils_torch.inference_mode():
             self.model.eval()
             for inputs, _, _ in loader:
-                predicted = self.model.forward(inputs)
-                predicted_vectors.append(predicted.detach().numpy())
-
+                inputs = utils_torch.to_device(inputs, self.config_train.device, non_blocking=True)
                 if include_components:
-                    components = self.model.compute_components(inputs)
-                    if component_vectors is None:
-                        component_vectors = {name: [value.detach().numpy()] for name, value in components.items()}
-                    else:
-                        for name, value in components.items():
-                            component_vectors[name].append(value.detach().numpy())
-
-        predicted = np.concatenate(predicted_vectors)
-        data_params = self.config_normalization.get_data_params(df_name)
-        scale_y, shift_y = data_params["y"].scale, data_params["y"].shift
-        predicted = predicted * scale_y + shift_y
+                    # evaluate each component once and assemble the forecast from them
+                    predicted, components = self.model(inputs, return_components=True)
+                else:
+                    predicted = self.model(inputs)
+                batch_size = predicted.shape[0]
+                if predicted_all is None:
+                    predicted_all = predicted.new_empty((n_samples,) + predicted.shape[1:])
+                predicted_all[offset : offset + batch_size] = predicted
 
+                if include_components:
+                    if components_all is None:
+                        components_all = {
+                            name: value.new_empty((n_samples,) + value.shape[1:]) for name, value in components.items()
+                        }
+                    for name, value in components.items():
+                        components_all[name][offset : offset + batch_size] = value
+                offset += batch_size
+        # on CUDA, the forecast and all components are copied to pinned host memory with a single synchronization
+        host_arrays = utils_torch.to_numpy({"_predicted": predicted_all, **(components_all or {})})
+        predicted_all = host_arrays.pop("_predicted")
         if include_components:
-            components = {name: np.concatenate(value) for name, value in component_vectors.items()}
-            for name, value in components.items():
-                if "multiplicative" in name:
-                    continue
-                elif "event_" in name:
-                    event_name = name.split("_")[1]
-                    if self.events_config is not None and event_name in self.events_config:
-                        if self.events_config[event_name].mode == "multiplicative":
-                            continue
-                    elif (
-                        self.country_holidays_config is not None
-                        and event_name in self.country_holidays_config.holiday_names
-                    ):
-                        if self.country_holidays_config.mode == "multiplicative":
-                            continue
-                elif "season" in name and self.season_config.mode == "multiplicative":
+            components_all = host_arrays
+
+        # denormalize all samples at once, each dataframe's y scale and shift repeated over its samples.
+        # a scale or shift shared by all dataframes stays scalar, and is skipped entirely if it is the identity.
+        scale_shift = self.config_normalization.get_y_scale_shift(df_dict.keys()).astype(predicted_all.dtype)
+        scale_y, shift_y = [
+            values[0] if (values == values[0]).all() else np.repeat(values, dataset.lengths)[:, np.newaxis]
+            for values in scale_shift.T
+        ]
+        scale_y_identity = np.ndim(scale_y) == 0 and scale_y == 1.0
+        shift_y_identity = np.ndim(shift_y) == 0 and shift_y == 0.0
+        if not scale_y_identity:
+            predicted_all *= scale_y
+        if not shift_y_identity:
+            predicted_all += shift_y
+        if include_components:
+            # configs are fixed once the model is fitted, classify its components only on first use
+            if self._multiplicative_component_names is None:
+                self._multiplicative_component_names = frozenset(
+                    name for name in components_all if not self._is_additive_component(name)
+                )
+            # multiplicative components are relative and stay unscaled
+            for name, value in components_all.items():
+                if name in self._multiplicative_component_names:
                     continue
+                if not scale_y_identity:
+                    value *= scale_y
+                if not shift_y_identity and "trend" in name:
+                    value += shift_y
+
+        # split samples back into their dataframes
+        split_idx = np.cumsum(dataset.lengths)[:-1]
+        predicted_split = np.split(predicted_all, split_idx)
+        if include_components:
+            components_split = {name: np.split(value, split_idx) for name, value in components_all.items()}
 
-                # scale additive components
-                components[name] = value * scale_y
-                if "trend" in name:
-                    components[name] += shift_y
-        else:
-            components = None
-        return dates, predicted, components
+        results = {}
+        for i, (df_name, df) in enumerate(df_dict.items()):
+            if self.n_forecasts > 1:
+                dates = df["ds"].iloc[self.n_lags : -self.n_forecasts + 1]
+            else:
+                dates = df["ds"].iloc[self.n_lags :]
+            if include_components:
+                components = {name: value[i] for name, value in components_split.items()}
+            else:
+                components = None
+            results[df_name] = (dates, predicted_split[i], components)
+        return results
+
+    def _is_additive_component(self, name):
+        """Whether a forecast component is additive, i.e. on the scale of ``y`` rather than relative to the trend.
+
+        Parameters
+        ----------
+            name : str
+                component name as returned by ``TimeNet.compute_components``
+
+        Returns
+        -------
+            bool
+        """
+        if "multiplicative" in name:
+            return False
+        elif "event_" in name:
+            event_name = name.split("_")[1]
+            if self.events_config is not None and event_name in self.events_config:
+                return self.events_config[event_name].mode != "multiplicative"
+            elif self.country_holidays_config is not None and event_name in self.country_holidays_config.holiday_names:
+                return self.country_holidays_config.mode != "multiplicative"
+        elif "season" in name:
+            return self.season_config.mode != "multiplicative"
+        return True
 
     def _convert_raw_predictions_to_raw_df(self, dates, predicted, components=None):
         """Turns forecast-origin-wise predictions into forecast-target-wise predictions.
@@ -2235,16 +2435,17 @@ class NeuralProphet:
         """
         if isinstance(dates, dict):
             raise ValueError("Receiced more than one DataFrame. Use a for loop for many dataframes.")
-        predicted_names = ["step{}".format(i) for i in range(self.n_forecasts)]
-        all_data = predicted
-        all_names = predicted_names
+        all_names = ["step{}".format(i) for i in range(self.n_forecasts)]
+        blocks = [predicted]
         if components is not None:
             for comp_name, comp_data in components.items():
-                all_data = np.concatenate((all_data, comp_data), 1)
+                blocks.append(comp_data)
                 all_names += ["{}{}".format(comp_name, i) for i in range(self.n_forecasts)]
+        # a single concatenation allocates the result once, instead of re-copying it for every component
+        all_data = np.concatenate(blocks, axis=1) if len(blocks) > 1 else predicted
 
         df_raw = pd.DataFrame(data=all_data, columns=all_names)
-        df_raw.insert(0, "ds", dates.values)
+        df_raw.insert(0, "ds", dates.to_numpy(copy=False))
         return df_raw
 
     def _reshape_raw_predictions_to_forecst_df(self, df, predicted, components):  # DOES NOT ACCEPT DICT
@@ -2272,41 +2473,62 @@ class NeuralProphet:
         if isinstance(df, dict):
             raise ValueError("Receiced more than one DataFrame. Use a for loop for many dataframes.")
         cols = ["ds", "y"]  # cols to keep from df
-        df_forecast = pd.concat((df[cols],), axis=1)
+        forecast_cols = {}
 
         # create a line for each forecast_lag
         # 'yhat<i>' is the forecast for 'y' at 'ds' from i steps ago.
+        yhats = self._shift_forecast_lags(predicted)
+        # residuals of all forecast lags in one pass, NaN (not None) where y or the forecast is missing
+        residuals = yhats - df["y"].to_numpy(dtype=np.float64)[:, np.newaxis]
         for forecast_lag in range(1, self.n_forecasts + 1):
-            forecast = predicted[:, forecast_lag - 1]
-            pad_before = self.n_lags + forecast_lag - 1
-            pad_after = self.n_forecasts - forecast_lag
-            yhat = np.concatenate(([None] * pad_before, forecast, [None] * pad_after))
-            df_forecast["yhat{}".format(forecast_lag)] = yhat
-            df_forecast["residual{}".format(forecast_lag)] = yhat - df_forecast["y"]
-        if components is None:
-            return df_forecast
-
-        # else add components
-        lagged_components = [
-            "ar",
-        ]
-        if self.config_covar is not None:
-            for name in self.config_covar.keys():
-                lagged_components.append("lagged_regressor_{}".format(name))
-        for comp in lagged_components:
-            if comp in components:
-                for forecast_lag in range(1, self.n_forecasts + 1):
-                    forecast = components[comp][:, forecast_lag - 1]
-                    pad_before = self.n_lags + forecast_lag - 1
-                    pad_after = self.n_forecasts - forecast_lag
-                    yhat = np.concatenate(([None] * pad_before, forecast, [None] * pad_after))
-                    df_forecast["{}{}".format(comp, forecast_lag)] = yhat
-
-        # only for non-lagged components
-        for comp in components:
-            if comp not in lagged_components:
-                forecast_0 = components[comp][0, :]
-                forecast_rest = components[comp][1:, self.n_forecasts - 1]
-                yhat = np.concatenate(([None] * self.n_lags, forecast_0, forecast_rest))
-                df_forecast[comp] = yhat
+            forecast_cols["yhat{}".format(forecast_lag)] = yhats[:, forecast_lag - 1]
+            forecast_cols["residual{}".format(forecast_lag)] = residuals[:, forecast_lag - 1]
+        if components is not None:
+            lagged_components = [
+                "ar",
+            ]
+            if self.config_covar is not None:
+                for name in self.config_covar.keys():
+                    lagged_components.append("lagged_regressor_{}".format(name))
+            for comp in lagged_components:
+                if comp in components:
+                    comp_yhats = self._shift_forecast_lags(components[comp])
+                    for forecast_lag in range(1, self.n_forecasts + 1):
+                        forecast_cols["{}{}".format(comp, forecast_lag)] = comp_yhats[:, forecast_lag - 1]
+
+            # only for non-lagged components
+            # all steps of the first origin, then the last step of every further origin, after n_lags NaN
+            for comp in components:
+                if comp not in lagged_components:
+                    values = components[comp]
+                    yhat = np.full(self.n_lags + values.shape[0] + self.n_forecasts - 1, np.nan)
+                    yhat[self.n_lags : self.n_lags + self.n_forecasts] = values[0, :]
+                    yhat[self.n_lags + self.n_forecasts :] = values[1:, self.n_forecasts - 1]
+                    forecast_cols[comp] = yhat
+        # assemble the kept and all new columns in a single concat instead of inserting them one by one
+        df_forecast = pd.concat((df[cols], pd.DataFrame(forecast_cols, index=df.index)), axis=1)
         return df_forecast
+
+    def _shift_forecast_lags(self, forecast):
+        """Aligns forecast-origin-wise values to the datetime they forecast.
+
+        Parameters
+        ----------
+            forecast : np.array
+                array of dims (n_origins, n_forecasts) containing the values for each forecast origin
+
+        Returns
+        -------
+            np.array
+                array of dims (n_lags + n_origins + n_forecasts - 1, n_forecasts), padded with NaN,
+                where column i holds the (i+1)-step-ahead value for each row's datetime.
+        """
+        n_origins = forecast.shape[0]
+        # filled step by step in a (n_forecasts, rows) layout, so that every step is one contiguous slice copy.
+        # value of step i forecasted at origin o targets row n_lags + o + i, so step i starts at row n_lags + i
+        shifted = np.full((self.n_forecasts, self.n_lags + n_origins + self.n_forecasts - 1), np.nan)
+        starts = self.n_lags + np.arange(self.n_forecasts)
+        for row, start, values in zip(shifted, starts.tolist(), forecast.T):
+            row[start : start + n_origins] = values
+        # transposed view, each column stays contiguous
+        return shifted.T
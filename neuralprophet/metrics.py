@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from collections import OrderedDict
-import numpy as np
 import pandas as pd
+import torch
 import logging
 
 log = logging.getLogger("NP.metrics")
@@ -232,7 +232,9 @@ class Metric:
         if self._num_examples == 0:
             self._no_sample_error()
         value = self._sum / self._num_examples
-        # value = value.data.item()
+        if isinstance(value, torch.Tensor):
+            # batch values are accumulated on the device, synchronize only here
+            value = value.item()
         if save:
             self.stored_values.append(value)
         return value
@@ -313,6 +315,29 @@ class BatchMetric(Metric):
         """
         pass
 
+    def _denormalized_errors(self, predicted, target):
+        """Computes the errors on the original data scale, in double precision like the loss metrics.
+
+        The data shift cancels out in the difference, only the scale is applied.
+
+        Parameters
+        ----------
+            predicted : torch.Tensor
+                Output from the model's forward function.
+            target : torch.Tensor
+                actual values
+
+        Returns
+        -------
+            torch.Tensor
+                errors, on the device of the inputs
+        """
+        errors = (predicted - target).double()
+        shift_scale = getattr(self, "shift_scale", None)
+        if shift_scale is not None:
+            errors = errors * shift_scale[1]
+        return errors
+
     @abstractmethod
     def new(self, specific_column=None):
         """
@@ -341,13 +366,8 @@ class MAE(BatchMetric):
         self.shift_scale = shift_scale
 
     def _update_batch_value(self, predicted, target, **kwargs):
-        predicted = predicted.numpy()
-        target = target.numpy()
-        if self.shift_scale is not None:
-            predicted = self.shift_scale[1] * predicted + self.shift_scale[0]
-            target = self.shift_scale[1] * target + self.shift_scale[0]
-        absolute_errors = np.abs(predicted - target)
-        return np.mean(absolute_errors)
+        errors = self._denormalized_errors(predicted, target)
+        return torch.mean(torch.abs(errors))
 
     def set_shift_scale(self, shift_scale):
         """Adds data denormalization params
@@ -389,13 +409,8 @@ class MSE(BatchMetric):
         self.shift_scale = shift_scale
 
     def _update_batch_value(self, predicted, target, **kwargs):
-        predicted = predicted.numpy()
-        target = target.numpy()
-        if self.shift_scale is not None:
-            predicted = self.shift_scale[1] * predicted + self.shift_scale[0]
-            target = self.shift_scale[1] * target + self.shift_scale[0]
-        squared_errors = (predicted - target) ** 2
-        return np.mean(squared_errors)
+        errors = self._denormalized_errors(predicted, target)
+        return torch.mean(errors**2)
 
     def set_shift_scale(self, shift_scale):
         """Adds data denormalization params.
@@ -437,13 +452,8 @@ class RMSE(BatchMetric):
         self.shift_scale = shift_scale
 
     def _update_batch_value(self, predicted, target, **kwargs):
-        predicted = predicted.numpy()
-        target = target.numpy()
-        if self.shift_scale is not None:
-            predicted = self.shift_scale[1] * predicted + self.shift_scale[0]
-            target = self.shift_scale[1] * target + self.shift_scale[0]
-        squared_errors = (predicted - target) ** 2
-        return np.sqrt(np.mean(squared_errors))
+        errors = self._denormalized_errors(predicted, target)
+        return torch.sqrt(torch.mean(errors**2))
 
     def set_shift_scale(self, shift_scale):
         """Adds data denormalization params.
@@ -495,7 +505,8 @@ class LossMetric(BatchMetric):
         average_loss = self._loss_fn(predicted, target, **kwargs).mean()
         if len(average_loss.shape) != 0:
             raise ValueError("loss_fn did not return the average loss.")
-        return average_loss.data.item()
+        # keep the value on the device, it is only synchronized in compute()
+        return average_loss.detach().double()
 
     def new(self, specific_column=None):
         if specific_column is None and self.specific_column is not None:
@@ -513,9 +524,12 @@ class ValueMetric(Metric):
         """
 
         Args:
-            avg_value (float): average value over batch/update step
+            avg_value (float, torch.Tensor): average value over batch/update step
             num (int): number of samples in batch/update step
         """
         self.total_updates += 1
-        self._sum += avg_value.data.item() * num
+        if isinstance(avg_value, torch.Tensor):
+            # keep the value on the device, it is only synchronized in compute()
+            avg_value = avg_value.detach().double()
+        self._sum += avg_value * num
         self._num_examples += num
@@ -60,7 +60,7 @@ def plot(fcst, ax=None, xlabel="ds", ylabel="y", highlight_forecast=None, line_p
 
     if highlight_forecast is not None:
         if line_per_origin:
-            num_forecast_steps = sum(fcst["yhat1"].notna())
+            num_forecast_steps = int(fcst["yhat1"].notna().sum())
             steps_from_last = num_forecast_steps - highlight_forecast
             for i in range(len(yhat_col_names)):
                 x = ds[-(1 + i + steps_from_last)]
@@ -315,7 +315,7 @@ def plot_forecast_component(
         artists += ax.bar(fcst_t, y, width=1.00, color="#0072B2")
     else:
         artists += ax.plot(fcst_t, y, ls="-", c="#0072B2")
-        if add_x or sum(fcst[comp_name].notna()) == 1:
+        if add_x or fcst[comp_name].notna().sum() == 1:
             artists += ax.plot(fcst_t, y, "bx")
     # Specify formatting to workaround matplotlib issue #12925
     locator = AutoDateLocator(interval_multiples=False)
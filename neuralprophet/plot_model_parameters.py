@@ -6,7 +6,7 @@ import numpy as np
 import pandas as pd
 import logging
 import torch
-from neuralprophet import time_dataset, df_utils
+from neuralprophet import time_dataset, df_utils, utils_torch
 from neuralprophet.utils import set_y_as_percent
 
 log = logging.getLogger("NP.plotting")
@@ -89,7 +89,7 @@ def plot_parameters(m, forecast_in_focus=None, weekly_start=0, yearly_start=0, f
             {
                 "plot_name": "lagged weights",
                 "comp_name": "AR",
-                "weights": m.model.ar_weights.detach().numpy(),
+                "weights": m.model.ar_weights.detach().cpu().numpy(),
                 "focus": forecast_in_focus,
             }
         )
@@ -105,9 +105,9 @@ def plot_parameters(m, forecast_in_focus=None, weekly_start=0, yearly_start=0, f
             mode = configs.mode
             regressor_param = m.model.get_reg_weights(regressor)
             if mode == "additive":
-                additive_future_regressors.append((regressor, regressor_param.detach().numpy()))
+                additive_future_regressors.append((regressor, regressor_param.detach().cpu().numpy()))
             else:
-                multiplicative_future_regressors.append((regressor, regressor_param.detach().numpy()))
+                multiplicative_future_regressors.append((regressor, regressor_param.detach().cpu().numpy()))
 
     additive_events = []
     multiplicative_events = []
@@ -116,7 +116,7 @@ def plot_parameters(m, forecast_in_focus=None, weekly_start=0, yearly_start=0, f
     if m.country_holidays_config is not None:
         for country_holiday in m.country_holidays_config.holiday_names:
             event_params = m.model.get_event_weights(country_holiday)
-            weight_list = [(key, param.detach().numpy()) for key, param in event_params.items()]
+            weight_list = [(key, param.detach().cpu().numpy()) for key, param in event_params.items()]
             mode = m.country_holidays_config.mode
             if mode == "additive":
                 additive_events = additive_events + weight_list
@@ -127,7 +127,7 @@ def plot_parameters(m, forecast_in_focus=None, weekly_start=0, yearly_start=0, f
     if m.events_config is not None:
         for event, configs in m.events_config.items():
             event_params = m.model.get_event_weights(event)
-            weight_list = [(key, param.detach().numpy()) for key, param in event_params.items()]
+            weight_list = [(key, param.detach().cpu().numpy()) for key, param in event_params.items()]
             mode = configs.mode
             if mode == "additive":
                 additive_events = additive_events + weight_list
@@ -139,13 +139,13 @@ def plot_parameters(m, forecast_in_focus=None, weekly_start=0, yearly_start=0, f
     if m.config_covar is not None:
         for name in m.config_covar.keys():
             if m.config_covar[name].as_scalar:
-                lagged_scalar_regressors.append((name, m.model.get_covar_weights(name).detach().numpy()))
+                lagged_scalar_regressors.append((name, m.model.get_covar_weights(name).detach().cpu().numpy()))
             else:
                 components.append(
                     {
                         "plot_name": "lagged weights",
                         "comp_name": 'Lagged Regressor "{}"'.format(name),
-                        "weights": m.model.get_covar_weights(name).detach().numpy(),
+                        "weights": m.model.get_covar_weights(name).detach().cpu().numpy(),
                         "focus": forecast_in_focus,
                     }
                 )
@@ -242,7 +242,7 @@ def plot_trend_change(m, ax=None, plot_name="Trend Change", figsize=(10, 6), df_
     cp_t = []
     for cp in m.model.config_trend.changepoints:
         cp_t.append(start + datetime.timedelta(seconds=cp * time_span_seconds))
-    weights = m.model.get_trend_deltas.detach().numpy()
+    weights = m.model.get_trend_deltas.detach().cpu().numpy()
     # add end-point to force scale to match trend plot
     cp_t.append(start + scale)
     weights = np.append(weights, [0.0])
@@ -282,11 +282,11 @@ def plot_trend(m, ax=None, plot_name="Trend", figsize=(10, 6), df_name="__df__")
     t_end = t_start + data_params["ds"].scale
     if m.config_trend.n_changepoints == 0:
         fcst_t = pd.Series([t_start, t_end]).dt.to_pydatetime()
-        trend_0 = m.model.bias.detach().numpy()
+        trend_0 = m.model.bias.detach().cpu().numpy()
         if m.config_trend.growth == "off":
             trend_1 = trend_0
         else:
-            trend_1 = trend_0 + m.model.trend_k0.detach().numpy()
+            trend_1 = trend_0 + m.model.trend_k0.detach().cpu().numpy()
 
         data_params = m.config_normalization.get_data_params(df_name)
         shift = data_params["y"].shift
@@ -407,9 +407,10 @@ def predict_one_season(m, name, n_steps=100, df_name="__df__"):
     features = time_dataset.fourier_series_t(
         t=t_i * config.period, period=config.period, series_order=config.resolution
     )
-    features = torch.from_numpy(np.expand_dims(features, 1))
-    predicted = m.model.seasonality(features=features, name=name)
-    predicted = predicted.squeeze().detach().numpy()
+    features = torch.from_numpy(np.expand_dims(features, 1)).type(torch.float).to(m.config_train.device)
+    with utils_torch.inference_mode():
+        predicted = m.model.seasonality(features=features, name=name)
+    predicted = predicted.squeeze().cpu().numpy()
     if m.season_config.mode == "additive":
         data_params = m.config_normalization.get_data_params(df_name)
         scale = data_params["y"].scale
@@ -420,9 +421,10 @@ def predict_one_season(m, name, n_steps=100, df_name="__df__"):
 def predict_season_from_dates(m, dates, name, df_name="__df__"):
     config = m.season_config.periods[name]
     features = time_dataset.fourier_series(dates=dates, period=config.period, series_order=config.resolution)
-    features = torch.from_numpy(np.expand_dims(features, 1))
-    predicted = m.model.seasonality(features=features, name=name)
-    predicted = predicted.squeeze().detach().numpy()
+    features = torch.from_numpy(np.expand_dims(features, 1)).type(torch.float).to(m.config_train.device)
+    with utils_torch.inference_mode():
+        predicted = m.model.seasonality(features=features, name=name)
+    predicted = predicted.squeeze().cpu().numpy()
     if m.season_config.mode == "additive":
         data_params = m.config_normalization.get_data_params(df_name)
         scale = data_params["y"].scale
@@ -1,8 +1,10 @@
 from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import torch
+from torch.utils.data import DataLoader, BatchSampler, RandomSampler, SequentialSampler, SubsetRandomSampler
 from torch.utils.data.dataset import Dataset
 from neuralprophet import hdays as hdays_part2
 import holidays as hdays_part1
@@ -13,32 +15,13 @@ import logging
 log = logging.getLogger("NP.time_dataset")
 
 
-class GlobalTimeDataset(Dataset):
-    def __init__(self, df_dict, **kwargs):
-        """Initialize Timedataset from time-series df.
-
-        Args:
-            df_dict (dict): containing pd.DataFrame time series data
-            **kwargs (): identical to tabularize_univariate_datetime
-        """
-        self.combined_timedataset = []
-        # TODO (future): vectorize
-        self.length = 0
-        for df_name, df in df_dict.items():
-            timedataset = TimeDataset(df, df_name, **kwargs)
-            self.length += timedataset.length
-            for i in range(0, len(timedataset)):
-                self.combined_timedataset.append(timedataset[i])
-
-    def __len__(self):
-        return self.length
-
-    def __getitem__(self, idx):
-        return self.combined_timedataset[idx]
-
-
 class TimeDataset(Dataset):
-    """Create a PyTorch dataset of a tabularized time-series"""
+    """Create a PyTorch dataset of a tabularized time-series
+
+    Inputs are stored column-wise, as one tensor per input (and per name for named inputs) over all samples.
+    An item can be retrieved by a single index or by a list of indices, the latter returning a whole batch
+    at once without collating single samples (see ``make_batch_loader``).
+    """
 
     def __init__(self, df, name, **kwargs):
         """Initialize Timedataset from time-series df.
@@ -65,32 +48,33 @@ class TimeDataset(Dataset):
             targets (np.array, float): identical to returns from tabularize_univariate_datetime
         """
         inputs_dtype = {
-            "time": torch.float,
-            # "changepoints": torch.bool,
-            "seasonalities": torch.float,
-            "events": torch.float,
-            "lags": torch.float,
-            "covariates": torch.float,
-            "regressors": torch.float,
+            "time": np.float32,
+            # "changepoints": np.bool_,
+            "seasonalities": np.float32,
+            "events": np.float32,
+            "lags": np.float32,
+            "covariates": np.float32,
+            "regressors": np.float32,
         }
-        targets_dtype = torch.float
+        targets_dtype = np.float32
         self.length = inputs["time"].shape[0]
 
+        # cast in numpy, so that the tensors share memory with the cast arrays (no copy if already matching)
         for key, data in inputs.items():
             if key in self.two_level_inputs or key == "events" or key == "regressors":
                 self.inputs[key] = OrderedDict({})
                 for name, features in data.items():
-                    self.inputs[key][name] = torch.from_numpy(features).type(inputs_dtype[key])
+                    self.inputs[key][name] = torch.from_numpy(np.ascontiguousarray(features, dtype=inputs_dtype[key]))
             else:
-                self.inputs[key] = torch.from_numpy(data).type(inputs_dtype[key])
-        self.targets = torch.from_numpy(targets).type(targets_dtype)
+                self.inputs[key] = torch.from_numpy(np.ascontiguousarray(data, dtype=inputs_dtype[key]))
+        self.targets = torch.from_numpy(np.ascontiguousarray(targets, dtype=targets_dtype))
         self.meta["df_name"] = self.name
 
     def __getitem__(self, index):
         """Overrides parent class method to get an item at index.
 
         Args:
-            index (int): sample location in dataset
+            index (int, list): sample location in dataset, or list of locations to get a batch
 
         Returns:
             sample (OrderedDict): model inputs
@@ -105,18 +89,15 @@ class TimeDataset(Dataset):
                 regressors (OrderedDict), all regressors both additive and multiplicative,
                     each with features (np.array, float) of dims: (n_lags)
             targets (torch tensor, float): targets to be predicted, dims: (n_forecasts)
+
+            With a list of indices, all dims are preceded by the batch dimension.
         """
-        # Future TODO: vectorize
         sample = OrderedDict({})
         for key, data in self.inputs.items():
-            if key in self.two_level_inputs:
+            if isinstance(data, dict):
                 sample[key] = OrderedDict({})
-                for name, period_features in self.inputs[key].items():
-                    sample[key][name] = period_features[index]
-            elif key == "events" or key == "regressors":
-                sample[key] = OrderedDict({})
-                for mode, features in self.inputs[key].items():
-                    sample[key][mode] = features[index, :, :]
+                for name, features in data.items():
+                    sample[key][name] = features[index]
             else:
                 sample[key] = data[index]
         targets = self.targets[index]
@@ -128,6 +109,81 @@ class TimeDataset(Dataset):
         return self.length
 
 
+class GlobalTimeDataset(TimeDataset):
+    def __init__(self, df_dict, **kwargs):
+        """Initialize Timedataset from time-series df.
+
+        The samples of all time series are concatenated into one set of input tensors.
+
+        Args:
+            df_dict (dict): containing pd.DataFrame time series data
+            **kwargs (): identical to tabularize_univariate_datetime
+        """
+        timedatasets = [TimeDataset(df, df_name, **kwargs) for df_name, df in df_dict.items()]
+        self.lengths = [len(timedataset) for timedataset in timedatasets]
+        self.length = sum(self.lengths)
+        self.inputs = OrderedDict({})
+        self.meta = OrderedDict({})
+        self.two_level_inputs = ["seasonalities", "covariates"]
+        if len(timedatasets) == 1:
+            # nothing to concatenate, share the tensors
+            self.inputs = timedatasets[0].inputs
+            self.targets = timedatasets[0].targets
+        else:
+            for key, data in timedatasets[0].inputs.items():
+                if isinstance(data, dict):
+                    self.inputs[key] = OrderedDict({})
+                    for name in data.keys():
+                        self.inputs[key][name] = torch.cat([td.inputs[key][name] for td in timedatasets])
+                else:
+                    self.inputs[key] = torch.cat([td.inputs[key] for td in timedatasets])
+            self.targets = torch.cat([td.targets for td in timedatasets])
+        self.df_names = np.repeat(np.array([td.name for td in timedatasets], dtype=object), self.lengths)
+
+    def __getitem__(self, index):
+        """Overrides parent class method to get an item at index.
+
+        Args:
+            index (int, list): sample location in dataset, or list of locations to get a batch
+
+        Returns:
+            identical to TimeDataset, with meta referring to the name(s) of the sample's time series
+        """
+        sample, targets, _ = super().__getitem__(index)
+        names = self.df_names[index]
+        meta = OrderedDict({"df_name": names if isinstance(names, str) else list(names)})
+        return sample, targets, meta
+
+
+def make_batch_loader(dataset, batch_size, shuffle=False, drop_last=False, indices=None, **kwargs):
+    """Create a DataLoader that retrieves whole batches from a TimeDataset.
+
+    Each batch is gathered by indexing the dataset's input tensors once with all batch indices,
+    instead of collating single samples.
+
+    Args:
+        dataset (TimeDataset): dataset supporting indexing by a list of indices
+        batch_size (int): number of samples per batch
+        shuffle (bool): whether to reshuffle the samples every epoch
+        drop_last (bool): whether to drop the last incomplete batch
+        indices (list): only load the samples at these indices, may contain repetitions
+        **kwargs (): passed on to DataLoader, e.g. num_workers, pin_memory
+
+    Returns:
+        torch DataLoader
+    """
+    if indices is not None:
+        sampler = SubsetRandomSampler(indices) if shuffle else list(indices)
+    else:
+        sampler = RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+    return DataLoader(
+        dataset,
+        sampler=BatchSampler(sampler, batch_size=batch_size, drop_last=drop_last),
+        batch_size=None,
+        **kwargs,
+    )
+
+
 def tabularize_univariate_datetime(
     df,
     predict_mode=False,
@@ -149,12 +205,12 @@ def tabularize_univariate_datetime(
         season_config (configure.Season): configuration for seasonalities.
         n_lags (int): number of lagged values of series to include as model inputs. Aka AR-order
         n_forecasts (int): number of steps to forecast into future.
-        events_config (OrderedDict): user specified events, each with their
+        events_config (dict): user specified events, each with their
             upper, lower windows (int) and regularization
-        country_holidays_config (OrderedDict): Configurations (holiday_names, upper, lower windows,
+        country_holidays_config (dict): Configurations (holiday_names, upper, lower windows,
             regularization) for country specific holidays
-        covar_config (OrderedDict<configure.Covar>): configuration for covariates
-        regressors_config (OrderedDict): configuration for regressors
+        covar_config (dict<configure.Covar>): configuration for covariates
+        regressors_config (dict): configuration for regressors
         predict_mode (bool): False (default) includes target values.
             True does not include targets but includes entire dataset as input
 
@@ -179,7 +235,8 @@ def tabularize_univariate_datetime(
 
     def _stride_time_features_for_forecasts(x):
         # only for case where n_lags > 0
-        return np.array([x[n_lags + i : n_lags + i + n_forecasts] for i in range(n_samples)], dtype=np.float64)
+        # windows are built in the model's float32, the dataset would cast them anyway
+        return np.array([x[n_lags + i : n_lags + i + n_forecasts] for i in range(n_samples)], dtype=np.float32)
 
     # time is the time at each forecast step
     t = df.loc[:, "t"].values
@@ -203,8 +260,8 @@ def tabularize_univariate_datetime(
     def _stride_lagged_features(df_col_name, feature_dims):
         # only for case where n_lags > 0
         series = df.loc[:, df_col_name].values
-        ## Added dtype=np.float64 to solve the problem with np.isnan for ubuntu test
-        return np.array([series[i + n_lags - feature_dims : i + n_lags] for i in range(n_samples)], dtype=np.float64)
+        ## Explicit float dtype to solve the problem with np.isnan for ubuntu test
+        return np.array([series[i + n_lags - feature_dims : i + n_lags] for i in range(n_samples)], dtype=np.float32)
 
     if n_lags > 0 and "y" in df.columns:
         inputs["lags"] = _stride_lagged_features(df_col_name="y_scaled", feature_dims=n_lags)
@@ -319,9 +376,19 @@ def fourier_series(dates, period, series_order):
     Returns:
         Matrix with seasonality features.
     """
-    # convert to days since epoch
-    t = np.array((dates - datetime(1970, 1, 1)).dt.total_seconds().astype(float)) / (3600 * 24.0)
-    return fourier_series_t(t, period, series_order)
+    return fourier_series_t(days_since_epoch(dates), period, series_order)
+
+
+def days_since_epoch(dates):
+    """Converts timestamps to floating point days since epoch.
+
+    Args:
+        dates (pd.Series): containing timestamps.
+
+    Returns:
+        np.array of floats
+    """
+    return np.array((dates - datetime(1970, 1, 1)).dt.total_seconds().astype(float)) / (3600 * 24.0)
 
 
 def fourier_series_t(t, period, series_order):
@@ -337,9 +404,11 @@ def fourier_series_t(t, period, series_order):
     Returns:
         Matrix with seasonality features.
     """
-    features = np.column_stack(
-        [fun((2.0 * (i + 1) * np.pi * t / period)) for i in range(series_order) for fun in (np.sin, np.cos)]
-    )
+    # all harmonics at once as an outer product, columns interleaved as sin_1, cos_1, sin_2, cos_2, ...
+    x = np.outer(np.asarray(t, dtype=float), 2.0 * np.pi * np.arange(1, series_order + 1) / period)
+    features = np.empty((x.shape[0], 2 * series_order))
+    np.sin(x, out=features[:, 0::2])
+    np.cos(x, out=features[:, 1::2])
     return features
 
 
@@ -368,13 +437,34 @@ def make_country_specific_holidays_df(year_list, country):
     return country_specific_holidays_dict
 
 
+@lru_cache(maxsize=32)
+def country_holiday_days(country, years):
+    """
+    Country specific holiday dates as sorted integer days since epoch, cached per country and years
+
+    Args:
+        country (string): country name
+        years (tuple): sorted years to cover
+
+    Returns:
+        dict of holiday name to np.array (int64) of days since epoch
+    """
+    country_holidays_dict = make_country_specific_holidays_df(list(years), country)
+    holiday_days = {}
+    for holiday, dates in country_holidays_dict.items():
+        days = np.unique(np.array(dates, dtype="datetime64[D]").astype(np.int64))
+        days.flags.writeable = False
+        holiday_days[holiday] = days
+    return holiday_days
+
+
 def make_events_features(df, events_config=None, country_holidays_config=None):
     """
     Construct arrays of all event features
 
     Args:
         df (pd.DataFrame): dataframe with all values including the user specified events (provided by user)
-        events_config (OrderedDict): user specified events, each with their
+        events_config (dict): user specified events, each with their
             upper, lower windows (int), regularization
         country_holidays_config (configure.Holidays): Configurations (holiday_names, upper, lower windows, regularization)
             for country specific holidays
@@ -391,7 +481,7 @@ def make_events_features(df, events_config=None, country_holidays_config=None):
     if events_config is not None:
         for event, configs in events_config.items():
             if event not in df.columns:
-                df[event] = np.zeros_like(df["ds"], dtype=np.float64)
+                df[event] = np.zeros_like(df["ds"], dtype=np.float32)
             feature = df[event]
             lw = configs.lower_window
             uw = configs.upper_window
@@ -410,13 +500,14 @@ def make_events_features(df, events_config=None, country_holidays_config=None):
         lw = country_holidays_config.lower_window
         uw = country_holidays_config.upper_window
         mode = country_holidays_config.mode
-        year_list = list({x.year for x in df.ds})
-        country_holidays_dict = make_country_specific_holidays_df(year_list, country_holidays_config.country)
+        ds_days = df["ds"].values.astype("datetime64[D]")
+        years = tuple(np.unique(ds_days.astype("datetime64[Y]").astype(np.int64) + 1970).tolist())
+        ds_days = ds_days.astype(np.int64)
+        holiday_days = country_holiday_days(country_holidays_config.country, years)
         for holiday in country_holidays_config.holiday_names:
-            feature = pd.Series([0.0] * df.shape[0])
-            if holiday in country_holidays_dict.keys():
-                dates = country_holidays_dict[holiday]
-                feature[df.ds.isin(dates)] = 1.0
+            feature = pd.Series(np.zeros(df.shape[0], dtype=np.float32))
+            if holiday in holiday_days:
+                feature = pd.Series(np.isin(ds_days, holiday_days[holiday]).astype(np.float32))
             for offset in range(lw, uw + 1):
                 key = utils.create_event_names_for_offsets(holiday, offset)
                 offset_feature = feature.shift(periods=offset, fill_value=0)
@@ -445,7 +536,7 @@ def make_regressors_features(df, regressors_config):
 
     Args:
         df (pd.DataFrame): dataframe with all values including the user specified regressors
-        regressors_config (OrderedDict): user specified regressors config
+        regressors_config (dict): user specified regressors config
 
     Returns:
         additive_regressors (np.array): all additive regressor features
@@ -492,12 +583,14 @@ def seasonal_features_from_dates(dates, season_config):
     """
     assert len(dates.shape) == 1
     seasonalities = OrderedDict({})
+    # convert once, shared by all seasonalities
+    t = days_since_epoch(dates)
     # Seasonality features
     for name, period in season_config.periods.items():
         if period.resolution > 0:
             if season_config.computation == "fourier":
-                features = fourier_series(
-                    dates=dates,
+                features = fourier_series_t(
+                    t=t,
                     period=period.period,
                     series_order=period.resolution,
                 )
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 import numpy as np
 import torch
 import torch.nn as nn
@@ -58,10 +57,10 @@ class TimeNet(nn.Module):
         Args:
             config_trend (configure.Trend):
             config_season (configure.Season):
-            config_covar (OrderedDict):
-            config_regressors (OrderedDict): Configs of regressors with mode and index.
-            config_events (OrderedDict):
-            config_holidays (OrderedDict):
+            config_covar (dict):
+            config_regressors (dict): Configs of regressors with mode and index.
+            config_events (dict):
+            config_holidays (dict):
             n_forecasts (int): number of steps to forecast. Aka number of model outputs.
             n_lags (int): number of previous steps of time series used as input. Aka AR-order.
                 0 (default): no auto-regression
@@ -90,9 +89,13 @@ class TimeNet(nn.Module):
                     self.config_trend.changepoints = self.config_trend.changepoints_range * linear_t
                 else:
                     self.config_trend.changepoints = np.insert(self.config_trend.changepoints, 0, 0.0)
-                self.trend_changepoints_t = torch.tensor(
-                    self.config_trend.changepoints, requires_grad=False, dtype=torch.float
-                )
+                # follows the model across devices. Derived from the config, thus kept out of the state_dict
+                # where supported (torch>=1.6).
+                changepoints_t = torch.tensor(self.config_trend.changepoints, requires_grad=False, dtype=torch.float)
+                try:
+                    self.register_buffer("trend_changepoints_t", changepoints_t, persistent=False)
+                except TypeError:
+                    self.register_buffer("trend_changepoints_t", changepoints_t)
                 self.trend_deltas = new_param(dims=[self.config_trend.n_changepoints + 1])  # including first segment
                 if self.config_trend.growth == "discontinuous":
                     self.trend_m = new_param(dims=[self.config_trend.n_changepoints + 1])  # including first segment
@@ -230,7 +233,7 @@ class TimeNet(nn.Module):
             name (string): Event name
 
         Returns:
-            event_param_dict (OrderedDict): Dict of the weights of all offsets corresponding
+            event_param_dict (dict): Dict of the weights of all offsets corresponding
             to a particular event.
         """
 
@@ -243,7 +246,7 @@ class TimeNet(nn.Module):
             assert mode == "additive"
             event_params = self.event_params["additive"]
 
-        event_param_dict = OrderedDict({})
+        event_param_dict = {}
         for event_delim, indices in zip(event_dims["event_delim"], event_dims["event_indices"]):
             event_param_dict[event_delim] = event_params[indices]
         return event_param_dict
@@ -282,12 +285,14 @@ class TimeNet(nn.Module):
         """
         past_next_changepoint = t.unsqueeze(2) >= torch.unsqueeze(self.trend_changepoints_t[1:], dim=0)
         segment_id = torch.sum(past_next_changepoint, dim=2)
-        current_segment = nn.functional.one_hot(segment_id, num_classes=self.config_trend.n_changepoints + 1)
+        # as float, to reduce over changepoints with a matmul
+        past_next_changepoint = past_next_changepoint.type(self.trend_deltas.dtype)
 
-        k_t = torch.sum(current_segment * torch.unsqueeze(self.trend_deltas, dim=0), dim=2)
+        # gather the rate of the current segment instead of masking with a one-hot encoding
+        k_t = self.trend_deltas[segment_id]
 
         if not self.segmentwise_trend:
-            previous_deltas_t = torch.sum(past_next_changepoint * torch.unsqueeze(self.trend_deltas[:-1], dim=0), dim=2)
+            previous_deltas_t = torch.matmul(past_next_changepoint, self.trend_deltas[:-1])
             k_t = k_t + previous_deltas_t
 
         if self.config_trend.growth != "discontinuous":
@@ -296,11 +301,11 @@ class TimeNet(nn.Module):
             else:
                 deltas = self.trend_deltas
             gammas = -self.trend_changepoints_t[1:] * deltas[1:]
-            m_t = torch.sum(past_next_changepoint * gammas, dim=2)
+            m_t = torch.matmul(past_next_changepoint, gammas)
             if not self.segmentwise_trend:
                 m_t = m_t.detach()
         else:
-            m_t = torch.sum(current_segment * torch.unsqueeze(self.trend_m, dim=0), dim=2)
+            m_t = self.trend_m[segment_id]
 
         return (self.trend_k0 + k_t) * t + m_t
 
@@ -334,7 +339,7 @@ class TimeNet(nn.Module):
         Returns:
             forecast component of dims (batch, n_forecasts)
         """
-        return torch.sum(features * torch.unsqueeze(self.season_params[name], dim=0), dim=2)
+        return torch.matmul(features, self.season_params[name])
 
     def all_seasonalities(self, s):
         """Compute all seasonality components.
@@ -346,10 +351,13 @@ class TimeNet(nn.Module):
         Returns:
             forecast component of dims (batch, n_forecasts)
         """
-        x = torch.zeros(s[list(s.keys())[0]].shape[:2])
-        for name, features in s.items():
-            x = x + self.seasonality(features, name)
-        return x
+        if len(s) == 1:
+            name, features = next(iter(s.items()))
+            return self.seasonality(features, name)
+        # one product over the concatenated features and weights of all seasonalities
+        features = torch.cat(list(s.values()), dim=2)
+        params = torch.cat([self.season_params[name] for name in s.keys()])
+        return torch.matmul(features, params)
 
     def scalar_features_effects(self, features, params, indices=None):
         """
@@ -366,7 +374,7 @@ class TimeNet(nn.Module):
             features = features[:, :, indices]
             params = params[indices]
 
-        return torch.sum(features * torch.unsqueeze(params, dim=0), dim=2)
+        return torch.matmul(features, params)
 
     def auto_regression(self, lags):
         """Computes auto-regessive model component AR-Net.
@@ -420,7 +428,7 @@ class TimeNet(nn.Module):
                 x = x + self.covariate(lags=covariates[name], name=name)
         return x
 
-    def forward(self, inputs):
+    def forward(self, inputs, return_components=False):
         """This method defines the model forward pass.
 
         Time input is required. Minimum model setup is a linear trend.
@@ -438,9 +446,13 @@ class TimeNet(nn.Module):
                     dims: (batch, n_forecasts, n_features)
                 regressors (torch tensor, float): all regressor features
                     dims: (batch, n_forecasts, n_features)
+            return_components (bool): also return the forecast components, see ``forward_with_components``.
+                Routing this through the module call keeps it on the compiled path of a compiled model.
         Returns:
             forecast of dims (batch, n_forecasts)
         """
+        if return_components:
+            return self.forward_with_components(inputs)
         additive_components = torch.zeros_like(inputs["time"])
         multiplicative_components = torch.zeros_like(inputs["time"])
 
@@ -557,6 +569,37 @@ class TimeNet(nn.Module):
                 )
         return components
 
+    def forward_with_components(self, inputs):
+        """Computes the forecast together with its components, evaluating each component only once.
+
+        Equivalent to calling ``forward`` and ``compute_components``, up to floating point rounding
+        from summing the components in a different order.
+        Args:
+            inputs (dict): model inputs, as for ``forward``
+        Returns:
+            forecast of dims (batch, n_forecasts)
+            dict of forecast_component: value
+                with elements of dims (batch, n_forecasts)
+        """
+        components = self.compute_components(inputs)
+        additive_components = torch.zeros_like(inputs["time"])
+        multiplicative_components = torch.zeros_like(inputs["time"])
+        for name, value in components.items():
+            if name == "ar" or name.startswith("lagged_regressor_"):
+                additive_components += value
+            elif name.startswith("season_"):
+                if self.config_season.mode == "additive":
+                    additive_components += value
+                elif self.config_season.mode == "multiplicative":
+                    multiplicative_components += value
+            elif name in ("events_additive", "future_regressors_additive"):
+                additive_components += value
+            elif name in ("events_multiplicative", "future_regressors_multiplicative"):
+                multiplicative_components += value
+        trend = components["trend"]
+        out = trend + additive_components + trend.detach() * multiplicative_components
+        return out, components
+
 
 class FlatNet(nn.Module):
     """
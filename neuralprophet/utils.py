@@ -4,7 +4,6 @@ import math
 import numpy as np
 import pandas as pd
 import torch
-from collections import OrderedDict
 from neuralprophet import hdays as hdays_part2
 import holidays as pyholidays
 import warnings
@@ -13,7 +12,7 @@ import logging
 log = logging.getLogger("NP.utils")
 
 
-def reg_func_abs(weights):
+def reg_func_abs(weights: torch.Tensor) -> torch.Tensor:
     """Regularization of weights to induce sparcity
 
     Args:
@@ -46,13 +45,31 @@ def reg_func_season(weights):
     return reg_func_abs(weights)
 
 
+def time_based_sample_weight(t: torch.Tensor, end_w: float, start_t: float) -> torch.Tensor:
+    """Weights samples along a cosine ramp so that newer samples count more
+
+    Args:
+        t (torch tensor): normalized sample times
+        end_w (float): weight of the newest sample relative to the oldest, > 1
+        start_t (float): normalized time before which all samples get the lowest weight
+
+    Returns:
+        sample weights, same shape as t, with the newest sample weighted 1.0
+    """
+    # only the first subtraction allocates, all further steps work in place on that fresh tensor
+    weight = (t - start_t).div_(1.0 - start_t).clamp_(0.0, 1.0)  # time = 0 to 1
+    weight.sub_(1.0).mul_(math.pi).cos_().mul_(0.5).add_(0.5)  # cosine ramp from 0 to 1
+    # scales end to be end weight times bigger than start weight
+    return weight.mul_(end_w - 1.0).add_(1.0).mul_(1.0 / end_w)
+
+
 def reg_func_events(events_config, country_holidays_config, model):
     """
     Regularization of events coefficients to induce sparcity
 
     Args:
-        events_config (OrderedDict): Configurations (upper, lower windows, regularization) for user specified events
-        country_holidays_config (OrderedDict): Configurations (holiday_names, upper, lower windows, regularization)
+        events_config (dict): Configurations (upper, lower windows, regularization) for user specified events
+        country_holidays_config (dict): Configurations (holiday_names, upper, lower windows, regularization)
             for country specific holidays
         model (TimeNet): The TimeNet model object
 
@@ -82,7 +99,7 @@ def reg_func_regressors(regressors_config, model):
     """
     Regularization of regressors coefficients to induce sparcity
     Args:
-        regressors_config (OrderedDict): Configurations for user specified regressors
+        regressors_config (dict): Configurations for user specified regressors
         model (TimeNet): The TimeNet model object
     Returns:
         regularization loss, scalar
@@ -123,7 +140,7 @@ def season_config_to_model_dims(season_config):
     """
     if season_config is None or len(season_config.periods) < 1:
         return None
-    seasonal_dims = OrderedDict({})
+    seasonal_dims = {}
     for name, period in season_config.periods.items():
         resolution = period.resolution
         if season_config.computation == "fourier":
@@ -166,12 +183,12 @@ def events_config_to_model_dims(events_config, country_holidays_config):
     Convert the NeuralProphet user specified events configurations along with country specific
         holidays to input dims for TimeNet model.
     Args:
-        events_config (OrderedDict): Configurations (upper, lower windows, regularization) for user specified events
+        events_config (dict): Configurations (upper, lower windows, regularization) for user specified events
         country_holidays_config (configure.Holidays): Configurations (holiday_names, upper, lower windows, regularization)
             for country specific holidays
 
     Returns:
-        events_dims (OrderedDict): A dictionary with keys corresponding to individual holidays
+        events_dims (dict): A dictionary with keys corresponding to individual holidays
             containing configs with properties such as the mode, list of event delims of the event corresponding to the offsets,
             and the indices in the input dataframe corresponding to each event.
     """
@@ -222,7 +239,7 @@ def events_config_to_model_dims(events_config, country_holidays_config):
         multiplicative_events_dims["mode"] = "multiplicative"
         event_dims = event_dims.append(multiplicative_events_dims)
 
-    event_dims_dic = OrderedDict({})
+    event_dims_dic = {}
     # convert to dict format
     for event, row in event_dims.groupby("event"):
         event_dims_dic[event] = {
@@ -251,10 +268,10 @@ def regressors_config_to_model_dims(regressors_config):
     """
     Convert the NeuralProphet user specified regressors configurations to input dims for TimeNet model.
     Args:
-        regressors_config (OrderedDict): Configurations for user specified regressors
+        regressors_config (dict): Configurations for user specified regressors
 
     Returns:
-        regressors_dims (OrderedDict): A dictionary with keys corresponding to individual regressors
+        regressors_dims (dict): A dictionary with keys corresponding to individual regressors
             and values in a dict containing the mode, and the indices in the input dataframe corresponding to each regressor.
     """
     if regressors_config is None:
@@ -285,7 +302,7 @@ def regressors_config_to_model_dims(regressors_config):
             multiplicative_regressors_dims["mode"] = "multiplicative"
             regressors_dims = regressors_dims.append(multiplicative_regressors_dims)
 
-        regressors_dims_dic = OrderedDict({})
+        regressors_dims_dic = {}
         # convert to dict format
         for index, row in regressors_dims.iterrows():
             regressors_dims_dic[row["regressors"]] = {"mode": row["mode"], "regressor_index": index}
@@ -342,7 +359,7 @@ def set_auto_seasonalities(df, season_config):
             resolution = int(arg)
         season_config.periods[name].resolution = resolution
 
-    new_periods = OrderedDict({})
+    new_periods = {}
     for name, period in season_config.periods.items():
         if period.resolution > 0:
             new_periods[name] = period
@@ -354,7 +371,7 @@ def set_auto_seasonalities(df, season_config):
 
 def print_epoch_metrics(metrics, val_metrics=None, e=0):
     if val_metrics is not None and len(val_metrics) > 0:
-        val = OrderedDict({"{}_val".format(key): value for key, value in val_metrics.items()})
+        val = {"{}_val".format(key): value for key, value in val_metrics.items()}
         metrics = {**metrics, **val}
     metrics_df = pd.DataFrame(
         {
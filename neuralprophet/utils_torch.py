@@ -1,11 +1,10 @@
 import numpy as np
 import logging
+import contextlib
 import torch
-from torch.utils.data import DataLoader, Subset
 import inspect
-from torch_lr_finder import LRFinder
 
-from neuralprophet import utils
+from neuralprophet import utils, time_dataset
 
 log = logging.getLogger("NP.utils_torch")
 
@@ -27,6 +26,7 @@ def lr_range_test(
     start_lr=1e-7,
     end_lr=100,
     plot=False,
+    pin_memory=False,
 ):
     if num_iter is None:
         num_iter = 50 + int(np.log10(100 + len(dataset)) * 25)
@@ -36,11 +36,16 @@ def lr_range_test(
     split_idx = int(0.7 * len(dataset))
     idx_train = np.random.choice(split_idx, size=n_train)
     idx_val = np.random.choice(np.arange(split_idx, len(dataset)), size=n_val)
-    train_data = Subset(dataset, idx_train)
-    val_data = Subset(dataset, idx_val)
-    lrtest_loader = DataLoader(train_data, batch_size=batch_size, shuffle=True)
-    lrtest_loader_val = DataLoader(val_data, batch_size=1024, shuffle=True)
+    lrtest_loader = time_dataset.make_batch_loader(
+        dataset, batch_size=batch_size, shuffle=True, indices=idx_train.tolist(), pin_memory=pin_memory
+    )
+    lrtest_loader_val = time_dataset.make_batch_loader(
+        dataset, batch_size=1024, shuffle=True, indices=idx_val.tolist(), pin_memory=pin_memory
+    )
     lrtest_optimizer = create_optimizer_from_config(optimizer, model.parameters(), start_lr)
+    # imported here, as it pulls in matplotlib
+    from torch_lr_finder import LRFinder
+
     with utils.HiddenPrints():
         lr_finder = LRFinder(model, lrtest_optimizer, loss_func)
         lr_finder.range_test(
@@ -96,3 +101,112 @@ def create_optimizer_from_config(optimizer_name, model_parameters, lr):
     else:
         raise ValueError
     return optimizer
+
+
+def to_device(data, device, non_blocking=False):
+    """Move a tensor or a (nested) dict of tensors to a device.
+
+    Args:
+        data (torch.Tensor, dict): tensor or dict of tensors, as returned by a TimeDataset loader
+        device (torch.device): target device
+        non_blocking (bool): overlap the copy with compute, effective for pinned memory only
+
+    Returns:
+        data on device, with the same structure
+    """
+    if isinstance(data, torch.Tensor):
+        return data.to(device, non_blocking=non_blocking)
+    if isinstance(data, dict):
+        return type(data)((k, to_device(v, device, non_blocking)) for k, v in data.items())
+    return data
+
+
+def to_numpy(tensors):
+    """Copy a dict of tensors to host numpy arrays.
+
+    Tensors on a CUDA device are copied asynchronously into pinned host memory, with a single synchronization
+    once all copies are enqueued instead of one blocking transfer per tensor.
+
+    Args:
+        tensors (dict): dict of tensors, all on the same device
+
+    Returns:
+        dict of np.array, with the same keys
+    """
+    if not any(tensor.is_cuda for tensor in tensors.values()):
+        return {name: tensor.numpy() for name, tensor in tensors.items()}
+    arrays = {}
+    for name, tensor in tensors.items():
+        host = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+        host.copy_(tensor, non_blocking=True)
+        arrays[name] = host
+    torch.cuda.current_stream(next(iter(tensors.values())).device).synchronize()
+    return {name: host.numpy() for name, host in arrays.items()}
+
+
+@contextlib.contextmanager
+def fast_cuda_math(device, allow_tf32=False):
+    """Context allowing TF32 matmuls on CUDA devices (Ampere or newer), restoring the previous precision on exit.
+
+    The model consists of linear layers only, so cuDNN convolution autotuning is not touched.
+
+    Args:
+        device (torch.device): device the model runs on; no effect if not CUDA
+        allow_tf32 (bool): whether float32 matmuls may run in TF32; no effect if ``False``
+    """
+    if not allow_tf32 or device.type != "cuda":
+        yield
+        return
+    if hasattr(torch, "set_float32_matmul_precision"):
+        matmul_precision = torch.get_float32_matmul_precision()
+        torch.set_float32_matmul_precision("high")
+        try:
+            yield
+        finally:
+            torch.set_float32_matmul_precision(matmul_precision)
+    else:
+        matmul_allow_tf32 = torch.backends.cuda.matmul.allow_tf32
+        torch.backends.cuda.matmul.allow_tf32 = True
+        try:
+            yield
+        finally:
+            torch.backends.cuda.matmul.allow_tf32 = matmul_allow_tf32
+
+
+def inference_mode():
+    """Context disabling autograd for pure inference, falling back to ``torch.no_grad`` on older torch versions."""
+    if hasattr(torch, "inference_mode"):
+        return torch.inference_mode()
+    return torch.no_grad()
+
+
+def compile_model(model, example_inputs, mode="reduce-overhead"):
+    """Compile a model with ``torch.compile``, if available.
+
+    Compilation is lazy, so the compiled model is run once on ``example_inputs`` to surface compilation errors
+    here, where a fallback is still possible, instead of at the first training step.
+
+    Args:
+        model (torch.nn.Module): model to compile, left unchanged
+        example_inputs (dict): a batch of model inputs, on the device of the model
+        mode (str): ``torch.compile`` mode. Falls back to ``default`` if the requested mode fails,
+            and to the eager model if both fail.
+
+    Returns:
+        compiled wrapper sharing the parameters of ``model``, or ``model`` itself if compilation failed
+    """
+    if not hasattr(torch, "compile"):
+        log.warning("torch.compile requires torch>=2.0, training eager model.")
+        return model
+    for m in [mode, "default"]:
+        try:
+            # n_lags and n_forecasts fix all but the batch dimension, which differs for the last batch.
+            # Automatic dynamic shapes compile one batch-size generic graph on the first mismatch
+            # instead of a new static graph for every batch size.
+            compiled = torch.compile(model, mode=m, dynamic=None)
+            compiled(example_inputs)
+            return compiled
+        except Exception as e:
+            log.warning("Failed to compile model with mode {}: {}".format(m, e))
+    log.warning("Training eager model.")
+    return model
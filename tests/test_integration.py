@@ -1181,6 +1181,21 @@ def test_minimal():
     forecast = m.predict(df)
 
 
+def test_compile_model():
+    log.info("testing: Compiled Model")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(
+        n_forecasts=3,
+        n_lags=5,
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        compile_model=True,
+    )
+    metrics_df = m.fit(df, freq="D")
+    forecast = m.predict(df)
+
+
 def test_metrics():
     log.info("testing: Plotting")
     df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
@@ -1207,3 +1222,24 @@ def test_progress_display():
             learning_rate=LR,
         )
         metrics_df = m.fit(df, progress=progress)
+
+
+def test_mixed_precision_bf16():
+    log.info("testing: Mixed precision bf16")
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(
+        n_forecasts=3,
+        n_lags=5,
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE,
+        learning_rate=LR,
+        mixed_precision="bf16",
+    )
+    assert m.config_train.autocast_dtype == torch.bfloat16
+    # bfloat16 keeps the range of float32, gradients are not scaled
+    assert m.config_train.get_grad_scaler() is None
+    metrics_df = m.fit(df, freq="D")
+    assert np.isfinite(metrics_df["SmoothL1Loss"]).all()
+    forecast = m.predict(df)
+    assert forecast["yhat1"].dtype == np.float64
+    assert forecast["yhat1"].iloc[5:].notnull().all()
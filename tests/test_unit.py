@@ -3,16 +3,20 @@
 import pytest
 import os
 import pathlib
+import pickle
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import logging
+import torch
 from torch.utils.data import DataLoader
 from neuralprophet import (
     NeuralProphet,
     df_utils,
     time_dataset,
     configure,
+    utils,
+    utils_torch,
 )
 
 log = logging.getLogger("NP.test")
@@ -597,3 +601,298 @@ def test_make_future():
         regressors_df=df_future_regressor,
     )
     assert len(future) == 10 + 5 + 3
+
+
+def test_input_df_unchanged():
+    # dataframes are only shallow-copied, make sure the user's data is not modified
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df.loc[3, "y"] = np.inf
+    df_orig = df.copy(deep=True)
+    m = NeuralProphet(
+        n_lags=5,
+        n_forecasts=3,
+        epochs=EPOCHS,
+        learning_rate=LR,
+    )
+    m.fit(df, freq="D")
+    future = m.make_future_dataframe(df, n_historic_predictions=True)
+    m.predict(future)
+    m.predict(df)
+    pd.testing.assert_frame_equal(df, df_orig)
+
+
+def test_predict_batch_size():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(
+        n_lags=5,
+        n_forecasts=3,
+        epochs=EPOCHS,
+        learning_rate=LR,
+    )
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+    # results do not depend on how the samples are batched, up to float32 rounding of the batched matmuls
+    pd.testing.assert_frame_equal(m.predict(df, batch_size=7), forecast, atol=1e-5)
+    with pytest.raises(ValueError):
+        m.predict(df, batch_size=0)
+
+
+def test_unpickle_without_y_scale_shift():
+    # models pickled before the y scale and shift cache was added can still predict
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    m = NeuralProphet(n_lags=3, epochs=EPOCHS, learning_rate=LR)
+    m.fit(df, freq="D")
+    forecast = m.predict(df)
+    del m.config_normalization._y_scale_shift
+    m = pickle.loads(pickle.dumps(m))
+    pd.testing.assert_frame_equal(m.predict(df), forecast)
+
+
+def test_fast_cuda_math_opt_in():
+    # TF32 is only allowed when opted in, and the previous precision is restored on exit
+    precision = torch.get_float32_matmul_precision()
+    with utils_torch.fast_cuda_math(torch.device("cuda"), allow_tf32=False):
+        assert torch.get_float32_matmul_precision() == precision
+    with utils_torch.fast_cuda_math(torch.device("cpu"), allow_tf32=True):
+        assert torch.get_float32_matmul_precision() == precision
+    with utils_torch.fast_cuda_math(torch.device("cuda"), allow_tf32=True):
+        assert torch.get_float32_matmul_precision() == "high"
+    assert torch.get_float32_matmul_precision() == precision
+
+
+def test_compile_model_fallback(monkeypatch):
+    # compilation errors surface at the first call of the compiled model, they must still lead to the eager model
+    def failing_compile(fn, *args, **kwargs):
+        def compiled(*args, **kwargs):
+            raise RuntimeError("compilation failed")
+
+        return compiled
+
+    monkeypatch.setattr(torch, "compile", failing_compile)
+    model = torch.nn.Linear(3, 2)
+    inputs = torch.rand(4, 3)
+    expected = model(inputs)
+    compiled = utils_torch.compile_model(model, example_inputs=inputs)
+    # the eager module itself is returned and runs
+    assert compiled is model
+    assert torch.equal(compiled(inputs), expected)
+
+
+def test_prep_copy_df_dict_deep_copy():
+    df = pd.DataFrame({"ds": pd.date_range("2020-01-01", periods=5), "y": np.arange(5.0)})
+    df_dict, received_unnamed_df = df_utils.prep_copy_df_dict(df)
+    assert received_unnamed_df
+    df_dict["__df__"]["y"].values[:] = -1.0
+    assert (df["y"] == np.arange(5.0)).all()
+
+
+def test_count_nans_at_end():
+    assert df_utils.count_nans_at_end(np.full(5, np.nan)) == 5
+    assert df_utils.count_nans_at_end(np.arange(5.0)) == 0
+    assert df_utils.count_nans_at_end(pd.Series([1.0, np.nan, 2.0, np.nan, np.nan])) == 2
+    assert df_utils.count_nans_at_end(np.array([])) == 0
+    # several columns: the longest run of trailing NaN of any column
+    df = pd.DataFrame({"a": [1.0, 2.0, np.nan], "b": [1.0, np.nan, np.nan], "c": [1.0, 2.0, 3.0]})
+    assert df_utils.count_nans_at_end(df) == 2
+
+
+def test_fill_linear_then_rolling_avg_dataframe():
+    n = 60
+    a = np.arange(n, dtype=float)
+    a[20:23] = np.nan
+    b = np.sin(np.arange(n) / 5)
+    b[10:50] = np.nan
+    c = np.cos(np.arange(n) / 7)
+    c[30:40] = np.nan
+    df = pd.DataFrame({"a": a, "b": b, "c": c})
+    df_filled, remaining_na = df_utils.fill_linear_then_rolling_avg(df, limit_linear=2, rolling=4)
+    # short gap is filled linearly, longer gaps only partly by the rolling average
+    assert remaining_na.to_dict() == {"a": 0, "b": 35, "c": 5}
+    np.testing.assert_allclose(df_filled["a"], np.arange(n, dtype=float))
+    # all columns are filled as if each was filled on its own
+    for col in df.columns:
+        series_filled, series_remaining_na = df_utils.fill_linear_then_rolling_avg(df[col], limit_linear=2, rolling=4)
+        assert series_remaining_na == remaining_na[col]
+        pd.testing.assert_series_equal(series_filled, df_filled[col])
+
+
+def test_event_features_windows():
+    df = pd.DataFrame({"ds": pd.date_range("2018-12-20", periods=800, freq="D"), "y": np.arange(800.0)})
+    events_df = pd.DataFrame(
+        {
+            "event": ["a", "a", "a", "b", "b"],
+            "ds": pd.to_datetime(["2019-01-05", "2019-07-04", "2020-12-31", "2019-02-01", "2021-02-20"]),
+        }
+    )
+    events_config = {
+        "a": configure.Event(lower_window=-2, upper_window=1, reg_lambda=None, mode="additive"),
+        "b": configure.Event(lower_window=0, upper_window=3, reg_lambda=None, mode="multiplicative"),
+        "c": configure.Event(lower_window=-1, upper_window=0, reg_lambda=None, mode="additive"),
+    }
+    df_events = df_utils.convert_events_to_features(df.copy(), events_config, events_df)
+    additive, multiplicative = time_dataset.make_events_features(df_events, events_config)
+    # reference: event features built row by row, then shifted for each window offset
+    expected = {"additive": {}, "multiplicative": {}}
+    for event, configs in events_config.items():
+        feature = pd.Series([0.0] * len(df))
+        feature[df.ds.isin(events_df[events_df.event == event].ds)] = 1.0
+        for offset in range(configs.lower_window, configs.upper_window + 1):
+            key = utils.create_event_names_for_offsets(event, offset)
+            expected[configs.mode][key] = feature.shift(periods=offset, fill_value=0.0)
+    for features, mode in [(additive, "additive"), (multiplicative, "multiplicative")]:
+        expected_df = pd.DataFrame(expected[mode])
+        np.testing.assert_array_equal(features, expected_df[sorted(expected_df.columns)].values)
+    assert additive.sum() == 3 * 4
+
+
+def test_holiday_features_windows():
+    df = pd.DataFrame({"ds": pd.date_range("2018-12-20", periods=800, freq="D"), "y": np.arange(800.0)})
+    holidays_config = configure.Holidays(country="US", lower_window=-1, upper_window=2, mode="multiplicative")
+    holidays_config.init_holidays(df)
+    additive, multiplicative = time_dataset.make_events_features(df.copy(), country_holidays_config=holidays_config)
+    assert additive is None
+    # reference: holiday features built from the holiday dates of each year, then shifted for each window offset
+    country_holidays = time_dataset.make_country_specific_holidays_df(list({x.year for x in df.ds}), "US")
+    expected = {}
+    for holiday in holidays_config.holiday_names:
+        feature = pd.Series([0.0] * len(df))
+        if holiday in country_holidays:
+            feature[df.ds.isin(country_holidays[holiday])] = 1.0
+        for offset in range(holidays_config.lower_window, holidays_config.upper_window + 1):
+            key = utils.create_event_names_for_offsets(holiday, offset)
+            expected[key] = feature.shift(periods=offset, fill_value=0)
+    expected = pd.DataFrame(expected)
+    np.testing.assert_array_equal(multiplicative, expected[sorted(expected.columns)].values)
+    assert multiplicative.sum() > 0
+    # holiday dates are cached per country and years, a second pass must give the same features
+    _, multiplicative_cached = time_dataset.make_events_features(df.copy(), country_holidays_config=holidays_config)
+    np.testing.assert_array_equal(multiplicative_cached, multiplicative)
+
+
+def test_forward_with_components():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df["A"] = np.sin(np.arange(len(df)) / 10.0)
+    df["B"] = np.cos(np.arange(len(df)) / 7.0)
+    df["C"] = np.arange(len(df)) % 5
+    m = NeuralProphet(
+        n_lags=5,
+        n_forecasts=3,
+        yearly_seasonality=True,
+        weekly_seasonality=True,
+        seasonality_mode="multiplicative",
+        epochs=EPOCHS,
+        learning_rate=LR,
+    )
+    m = m.add_future_regressor("A")
+    m = m.add_future_regressor("C", mode="multiplicative")
+    m = m.add_lagged_regressor("B")
+    m.fit(df, freq="D")
+    df_dict = m._normalize(m._prepare_dataframe_to_predict({"__df__": df}))
+    dataset = m._create_dataset(df_dict, predict_mode=True)
+    inputs, _, _ = dataset[list(range(len(dataset)))]
+    with torch.no_grad():
+        expected = m.model(inputs)
+        expected_components = m.model.compute_components(inputs)
+        for predicted, components in [
+            m.model.forward_with_components(inputs),
+            m.model(inputs, return_components=True),
+        ]:
+            assert torch.allclose(predicted, expected, atol=1e-6)
+            assert components.keys() == expected_components.keys()
+            assert {"trend", "season_weekly", "ar", "lagged_regressor_B", "future_regressor_A"} <= components.keys()
+            for name, value in components.items():
+                assert torch.allclose(value, expected_components[name], atol=1e-6), name
+
+
+def test_normalize_ds_array():
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df["ds"] = pd.to_datetime(df["ds"])
+    df_dict = {"df1": df[:200].copy(), "df2": df[200:].copy()}
+    for global_normalization in [True, False]:
+        config_normalization = configure.Normalization("auto", global_normalization, True, False)
+        config_normalization.init_data_params(df_dict)
+        for df_name, df_i in df_dict.items():
+            data_params = config_normalization.get_data_params(df_name)
+            t = df_utils.normalize(df_i.copy(), data_params)["t"].to_numpy()
+            # also accepts timestamps as strings
+            for ds in [df_i["ds"].to_numpy(), df_i["ds"].dt.strftime("%Y-%m-%d").to_numpy()]:
+                np.testing.assert_allclose(df_utils.normalize_ds_array(ds, data_params), t)
+        if not global_normalization:
+            # each series is scaled to its own time range
+            for df_name, df_i in df_dict.items():
+                data_params = config_normalization.get_data_params(df_name)
+                np.testing.assert_allclose(df_utils.normalize_ds_array(df_i["ds"][:1], data_params), 0.0)
+
+
+def test_make_batch_loader_indices():
+    df = pd.read_csv(AIR_FILE, index_col=False, nrows=NROWS)
+    df = df_utils.check_dataframe(df)
+    df_dict, _ = df_utils.prep_copy_df_dict(df)
+    _, global_data_params = df_utils.init_data_params(df_dict=df_dict, normalize="minmax")
+    df = df_utils.normalize(df, global_data_params)
+    dataset = time_dataset.TimeDataset(df, name="df", n_lags=3, n_forecasts=1)
+    # the normalized time identifies each sample
+    sample_t = dataset.inputs["time"][:, 0]
+
+    def loaded_t(loader):
+        return [inputs["time"][:, 0] for inputs, _, _ in loader]
+
+    indices = [5, 2, 2, 9, 0]
+    loader = time_dataset.make_batch_loader(dataset, batch_size=2, indices=indices)
+    batches = loaded_t(loader)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert torch.equal(torch.cat(batches), sample_t[indices])
+    batches = loaded_t(time_dataset.make_batch_loader(dataset, batch_size=2, indices=indices, drop_last=True))
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert torch.equal(torch.cat(batches), sample_t[indices[:4]])
+    # shuffling changes the order, but yields exactly the given samples, repetitions included
+    batches = loaded_t(time_dataset.make_batch_loader(dataset, batch_size=2, indices=indices, shuffle=True))
+    assert torch.equal(torch.cat(batches).sort().values, sample_t[indices].sort().values)
+    # without indices, every sample is loaded once, the last incomplete batch is dropped if requested
+    batches = loaded_t(time_dataset.make_batch_loader(dataset, batch_size=16, shuffle=True, drop_last=True))
+    assert all(len(batch) == 16 for batch in batches)
+    assert len(batches) == len(dataset) // 16
+    assert len(torch.cat(batches).unique()) == len(batches) * 16
+    batches = loaded_t(time_dataset.make_batch_loader(dataset, batch_size=16))
+    assert torch.equal(torch.cat(batches), sample_t)
+
+
+def test_mixed_precision_fp16_cpu_fallback():
+    config_train = configure.Train(
+        learning_rate=LR,
+        epochs=EPOCHS,
+        batch_size=8,
+        loss_func="Huber",
+        optimizer="AdamW",
+        device="cpu",
+        mixed_precision="fp16",
+    )
+    # float16 autocast needs CUDA, training falls back to full precision without loss scaling
+    assert config_train.autocast_dtype is None
+    assert config_train.get_grad_scaler() is None
+    with config_train.get_autocast():
+        assert torch.nn.Linear(3, 2)(torch.rand(4, 3)).dtype == torch.float32
+    with pytest.raises(ValueError):
+        configure.Train(
+            learning_rate=LR,
+            epochs=EPOCHS,
+            batch_size=8,
+            loss_func="Huber",
+            optimizer="AdamW",
+            mixed_precision="fp8",
+        )
+
+
+def test_check_dataframe_ds_index():
+    # an unsorted dataframe whose index is named like the ds column
+    df = pd.read_csv(PEYTON_FILE, nrows=NROWS)
+    df = df.iloc[::-1]
+    df.index = pd.Index(pd.to_datetime(df["ds"]), name="ds")
+    df_checked = df_utils.check_dataframe(df)
+    assert df_checked["ds"].is_monotonic_increasing
+    assert df_checked.index.name is None
+    # the caller's dataframe is left unchanged
+    assert df.index.name == "ds"
+    m = NeuralProphet(n_lags=3, epochs=EPOCHS, learning_rate=LR)
+    m.fit(df, freq="D")
+    m.predict(df)